@@ -16,24 +16,31 @@ Options:
 
 import sys
 import argparse
+from functools import lru_cache
 from wipekit.read.file_reader import FileManager
 
-def parse_options(option_list):
+@lru_cache(maxsize=None)
+def parse_options(option_tuple):
+    # Cached on the tuple of KEY=VALUE strings; callers must not mutate the returned dict
     opts = {}
-    for opt in option_list or []:
+    for opt in option_tuple:
         if '=' in opt:
             k, v = opt.split('=', 1)
             opts[k] = v
     return opts
 
-def main():
+@lru_cache(maxsize=1)
+def build_parser():
     parser = argparse.ArgumentParser(description="Universal File Reader Example")
     parser.add_argument('file', type=str, help='Path to the data file (csv, tsv, json, parquet, orc, avro)')
     parser.add_argument('--head', type=int, default=5, help='Number of rows to display')
     parser.add_argument('--option', action='append', help='Additional pandas read_* kwargs as KEY=VALUE')
-    args = parser.parse_args()
+    return parser
 
-    options = parse_options(args.option)
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    options = parse_options(tuple(args.option or ()))
     reader = FileManager()
     df = reader.read(args.file, **options)
     if df is not None:
@@ -0,0 +1,45 @@
+import pytest
+
+from wipekit.exceptions import ConfigurationError
+from wipekit.read.config import MySQLConfig, OracleConfig, PostgreSQLConfig
+
+
+def test_postgresql_from_dict_parses_strings():
+    config = PostgreSQLConfig.from_dict({
+        "database": "db", "user": "u", "password": "p",
+        "port": "6543", "stream_chunksize": "500", "reuse_cursors": "true",
+    })
+
+    assert config.host == "localhost"
+    assert config.port == 6543
+    assert config.stream_chunksize == 500
+    assert config.reuse_cursors is True
+    assert config.enable_prepared is False
+
+
+def test_mysql_from_dict_defaults():
+    config = MySQLConfig.from_dict({"database": "db", "user": "u", "password": "p"})
+
+    assert config.port == 3306
+    assert config.output_format == "dict"
+    assert config.use_pure is False
+
+
+def test_oracle_from_dict_optional_ints():
+    config = OracleConfig.from_dict({
+        "service_name": "svc", "user": "u", "password": "p", "max_string_size": "200",
+    })
+
+    assert config.max_string_size == 200
+    assert config.stream_chunksize is None
+
+
+@pytest.mark.parametrize("config", [
+    {"user": "u", "password": "p"},
+    {"database": "db", "user": "u", "password": "p", "port": True},
+    {"database": "db", "user": "u", "password": "p", "reuse_cursors": "maybe"},
+    {"database": "db", "user": "u", "password": "p", "output_format": "xml"},
+])
+def test_postgresql_from_dict_rejects_bad_config(config):
+    with pytest.raises(ConfigurationError):
+        PostgreSQLConfig.from_dict(config)
@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+
+from wipekit.read import FileManager
+
+
+def test_read_csv(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("id,name\n1,a\n2,b\n")
+
+    result = FileManager().read(path)
+
+    assert result["id"].tolist() == [1, 2]
+    assert result["name"].tolist() == ["a", "b"]
+
+
+def test_read_csv_columns(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("id,name\n1,a\n2,b\n")
+
+    result = FileManager().read(str(path), columns=["name"])
+
+    assert result.columns.tolist() == ["name"]
+
+
+def test_read_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "data.parquet"
+    pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]}).to_parquet(path)
+
+    result = FileManager().read(path, columns=["id"])
+
+    assert result.columns.tolist() == ["id"]
+    assert result["id"].tolist() == [1, 2, 3]
+
+
+def test_read_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        FileManager().read(tmp_path / "missing.csv")
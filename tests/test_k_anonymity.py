@@ -0,0 +1,14 @@
+import pandas as pd
+
+from wipekit.anonymization import KAnonymity
+
+
+def test_microaggregation_with_duplicates():
+    # With k=2 the sorted values split into groups {1, 2} and {2, 3}, so the two
+    # records holding 2 fall into different groups
+    df = pd.DataFrame({"age": [1.0, 2.0, 2.0, 3.0]}, index=[10, 20, 30, 40])
+
+    result = KAnonymity(k=2).anonymize(df, ["age"], numerical_method="microaggregation")
+
+    assert result["age"].tolist() == [1.5, 1.5, 2.5, 2.5]
+    assert result.index.tolist() == [10, 20, 30, 40]
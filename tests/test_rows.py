@@ -0,0 +1,27 @@
+import copy
+import pickle
+
+from wipekit.read.rows import Row, row_class
+
+
+def test_row_access_by_name_and_position():
+    row = row_class(("id", "name"))((1, "a"))
+
+    assert isinstance(row, Row)
+    assert row[0] == 1 and row["name"] == "a" and row.id == 1
+    assert row.get("missing", 0) == 0
+    assert dict(row.items()) == {"id": 1, "name": "a"}
+    assert row == (1, "a")
+
+
+def test_row_class_is_shared_per_columns():
+    assert row_class(("a", "b")) is row_class(("a", "b"))
+
+
+def test_row_pickles_and_copies():
+    row = row_class(("id", "name"))((1, "a"))
+
+    for clone in (pickle.loads(pickle.dumps(row)), copy.deepcopy(row)):
+        assert clone == row
+        assert clone.keys() == ("id", "name")
+        assert clone.name == "a"
@@ -5,14 +5,35 @@
 from typing import List, Dict, Union, Optional, Any
 import pandas as pd
 import numpy as np
-from collections import Counter
-from sklearn.preprocessing import KBinsDiscretizer
 
 from wipekit.logging import get_logger
 
 # Initialize module-level logger
 logger = get_logger("wipekit.anonymization.k_anonymity")
 
+# Columns longer than this use the numba microaggregation kernel when numba is installed
+_NUMBA_MIN_ROWS = 100_000
+
+try:
+    from numba import njit, prange
+except ImportError:
+    _microaggregate_numba = None
+else:
+    @njit(parallel=True, cache=True)
+    def _microaggregate_numba(sorted_values, order, k, out):
+        """Write the mean of each consecutive group of k sorted values to the group's original positions."""
+        n = sorted_values.shape[0]
+        n_groups = (n + k - 1) // k
+        for group in prange(n_groups):
+            start = group * k
+            end = min(start + k, n)
+            total = 0.0
+            for i in range(start, end):
+                total += sorted_values[i]
+            mean = total / (end - start)
+            for i in range(start, end):
+                out[order[i]] = mean
+
 class KAnonymity:
     """
     Implements the K-Anonymity data anonymization technique.
@@ -61,6 +82,16 @@ class KAnonymity:
             logger.error(f"Missing columns in DataFrame: {[col for col in quasi_identifiers if col not in df.columns]}")
             raise ValueError("All quasi-identifiers must be columns in the DataFrame")
 
+        # Nothing to anonymize without quasi-identifiers
+        if not quasi_identifiers:
+            logger.info("No quasi-identifiers given, returning data unchanged")
+            return df.copy()
+
+        # Data that already satisfies k-anonymity needs no transformation
+        if self._verify_k_anonymity(self._group_sizes(df, quasi_identifiers)):
+            logger.info(f"Data already satisfies k-anonymity with k={self.k}, returning data unchanged")
+            return df.copy()
+
         logger.info(f"Starting anonymization with k={self.k}", extra={
             "rows": len(df),
             "quasi_identifiers": quasi_identifiers,
@@ -71,25 +102,29 @@ class KAnonymity:
         # Create a copy to avoid modifying the original
         anonymized_df = df.copy()
 
+        # Resolve which quasi-identifiers are numeric once, from the frame's dtypes
+        numeric_columns = df.dtypes[quasi_identifiers].map(pd.api.types.is_numeric_dtype)
+
         # Process each quasi-identifier
-        for column in quasi_identifiers:
+        for column, is_numeric in numeric_columns.items():
             # Check data type to apply appropriate anonymization
-            if pd.api.types.is_numeric_dtype(anonymized_df[column]):
+            if is_numeric:
                 logger.debug(f"Anonymizing numerical column: {column} using method {numerical_method}")
-                anonymized_df = self._anonymize_numerical(
+                anonymized_df[column] = self._anonymize_numerical(
                     anonymized_df, column, method=numerical_method, bin_count=bin_count
                 )
             else:
                 logger.debug(f"Anonymizing categorical column: {column} using method {categorical_method}")
-                anonymized_df = self._anonymize_categorical(
+                anonymized_df[column] = self._anonymize_categorical(
                     anonymized_df, column, method=categorical_method
                 )
 
         # Check if k-anonymity is satisfied
-        if not self._verify_k_anonymity(anonymized_df, quasi_identifiers):
+        group_sizes = self._group_sizes(anonymized_df, quasi_identifiers)
+        if not self._verify_k_anonymity(group_sizes):
             logger.warning(f"K-anonymity not satisfied after initial processing, applying suppression")
             # If not, apply suppression on problematic records
-            anonymized_df = self._apply_suppression(anonymized_df, quasi_identifiers)
+            anonymized_df = self._apply_suppression(anonymized_df, quasi_identifiers, group_sizes)
 
         logger.info(f"Anonymization complete", extra={
             "original_rows": len(df),
@@ -103,7 +138,7 @@ class KAnonymity:
                              df: pd.DataFrame, 
                              column: str, 
                              method: str = 'binning',
-                             bin_count: int = 5) -> pd.DataFrame:
+                             bin_count: int = 5) -> pd.Series:
         """
         Anonymize a numerical column using the specified method.
 
@@ -114,43 +149,57 @@ class KAnonymity:
             bin_count (int): Number of bins for discretization
 
         Returns:
-            pd.DataFrame: DataFrame with the anonymized column
+            pd.Series: The anonymized column, aligned to the index of df
         """
-        result_df = df.copy()
-
         if method == 'binning':
-            # Use quantile-based discretization
-            discretizer = KBinsDiscretizer(n_bins=bin_count, encode='ordinal', strategy='quantile')
-            values = df[column].values.reshape(-1, 1)
-            binned_values = discretizer.fit_transform(values)
-
-            # Convert bin indices to bin ranges
-            bin_edges = discretizer.bin_edges_[0]
+            # Use quantile-based bin edges, dropping duplicates caused by repeated values
+            values = df[column].to_numpy(dtype=float)
+            bin_edges = np.unique(np.nanquantile(values, np.linspace(0, 1, bin_count + 1)))
+
+            # A constant column collapses to a single edge, i.e. one zero-width bin
+            if len(bin_edges) == 1:
+                bin_labels = [f"{bin_edges[0]:.2f}-{bin_edges[0]:.2f}"]
+                codes = np.where(np.isnan(values), -1, 0)
+                return pd.Series(pd.Categorical.from_codes(codes, categories=bin_labels),
+                                 index=df.index, name=column)
+
+            # Label each bin with its range and assign values to bins in one pass
             bin_labels = [f"{bin_edges[i]:.2f}-{bin_edges[i+1]:.2f}" for i in range(len(bin_edges)-1)]
-            result_df[column] = [bin_labels[int(x[0])] for x in binned_values]
+            return pd.cut(df[column], bins=bin_edges, labels=bin_labels,
+                          include_lowest=True, ordered=False)
 
         elif method == 'microaggregation':
-            # Group values and replace with group mean
-            sorted_values = sorted(df[column].values)
-            groups = [sorted_values[i:i+self.k] for i in range(0, len(sorted_values), self.k)]
-
-            # Create a mapping from original values to group means
-            value_to_mean = {}
-            for group in groups:
-                group_mean = sum(group) / len(group)
-                for value in group:
-                    value_to_mean[value] = group_mean
-
-            result_df[column] = df[column].map(value_to_mean)
+            # Sort once and split the sorted values into consecutive groups of k.
+            # Means are scattered back by position, so equal values that land in different
+            # groups each get their own group's mean; a stable sort keeps that split
+            # deterministic (in row order) across runs.
+            values = df[column].to_numpy(dtype=float)
+            if values.size == 0:
+                return pd.Series(values, index=df.index, name=column)
+            order = np.argsort(values, kind='stable')
+
+            # Fuse the group-mean and scatter passes for large columns
+            if _microaggregate_numba is not None and len(values) > _NUMBA_MIN_ROWS:
+                result = np.empty_like(values)
+                _microaggregate_numba(values[order], order, self.k, result)
+                return pd.Series(result, index=df.index, name=column)
+
+            group_starts = np.arange(0, len(values), self.k)
+            group_sizes = np.diff(np.append(group_starts, len(values)))
+
+            # Replace every value with the mean of its group (the last group may be smaller than k)
+            group_means = np.add.reduceat(values[order], group_starts) / group_sizes
+            result = np.empty_like(values)
+            result[order] = np.repeat(group_means, group_sizes)
+
+            return pd.Series(result, index=df.index, name=column)
         else:
             raise ValueError(f"Unsupported numerical anonymization method: {method}")
 
-        return result_df
-
     def _anonymize_categorical(self,
                                df: pd.DataFrame,
                                column: str,
-                               method: str = 'generalization') -> pd.DataFrame:
+                               method: str = 'generalization') -> pd.Series:
         """
         Anonymize a categorical column using the specified method.
 
@@ -160,95 +209,93 @@ class KAnonymity:
             method (str): Method to use ('generalization' or 'suppression')
 
         Returns:
-            pd.DataFrame: DataFrame with the anonymized column
+            pd.Series: The anonymized column, aligned to the index of df
         """
-        result_df = df.copy()
-
         if method == 'generalization':
-            # Count frequency of each value
-            value_counts = Counter(df[column])
+            replacement = 'Other'
+        elif method == 'suppression':
+            replacement = None
+        else:
+            raise ValueError(f"Unsupported categorical anonymization method: {method}")
 
-            # Identify values that don't meet k-anonymity
-            rare_values = {value for value, count in value_counts.items() if count < self.k}
+        column_values = df[column]
 
-            # Replace rare values with a general category
-            if rare_values:
-                result_df[column] = result_df[column].apply(
-                    lambda x: 'Other' if x in rare_values else x
-                )
+        # Count frequency of each value
+        value_counts = column_values.value_counts(dropna=False)
 
-        elif method == 'suppression':
-            # Count frequency of each value
-            value_counts = Counter(df[column])
+        # Identify values that don't meet k-anonymity
+        rare_values = value_counts.index[value_counts < self.k]
 
-            # Identify values that don't meet k-anonymity
-            rare_values = {value for value, count in value_counts.items() if count < self.k}
+        # Replace rare values with a general category (generalization) or NULL (suppression)
+        if len(rare_values) > 0:
+            if isinstance(column_values.dtype, pd.CategoricalDtype):
+                # Match on the integer category codes rather than the labels
+                rare_codes = column_values.cat.categories.get_indexer(rare_values)
+                mask = column_values.cat.codes.isin(rare_codes)
+                if replacement is not None and replacement not in column_values.cat.categories:
+                    column_values = column_values.cat.add_categories([replacement])
+            else:
+                mask = column_values.isin(rare_values)
+            column_values = column_values.mask(mask, replacement)
 
-            # Replace rare values with a NULL value
-            if rare_values:
-                result_df[column] = result_df[column].apply(
-                    lambda x: None if x in rare_values else x
-                )
+        # Store as category dtype so later groupbys hash integer codes instead of objects
+        return column_values.astype('category')
 
-        else:
-            raise ValueError(f"Unsupported categorical anonymization method: {method}")
+    def _group_sizes(self, df: pd.DataFrame, quasi_identifiers: List[str]) -> pd.Series:
+        """
+        Count the records in each equivalence class of the quasi-identifiers.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to group
+            quasi_identifiers (List[str]): List of quasi-identifier columns
 
-        return result_df
+        Returns:
+            pd.Series: Number of records per quasi-identifier combination
+        """
+        return df.groupby(quasi_identifiers, sort=False, observed=True).size()
 
-    def _verify_k_anonymity(self, df: pd.DataFrame, quasi_identifiers: List[str]) -> bool:
+    def _verify_k_anonymity(self, group_sizes: pd.Series) -> bool:
         """
-        Verify if the DataFrame satisfies k-anonymity for the given quasi-identifiers.
+        Verify if the equivalence classes satisfy k-anonymity.
 
         Args:
-            df (pd.DataFrame): The DataFrame to check
-            quasi_identifiers (List[str]): List of quasi-identifier columns
+            group_sizes (pd.Series): Equivalence class sizes as returned by `_group_sizes`
 
         Returns:
             bool: True if k-anonymity is satisfied, False otherwise
         """
-        # Count occurrences of each quasi-identifier combination
-        combination_counts = df.groupby(quasi_identifiers).size()
-
         # Check if all combinations appear at least k times
-        return combination_counts.min() >= self.k
+        return group_sizes.min() >= self.k
 
-    def _apply_suppression(self, df: pd.DataFrame, quasi_identifiers: List[str]) -> pd.DataFrame:
+    def _apply_suppression(self,
+                           df: pd.DataFrame,
+                           quasi_identifiers: List[str],
+                           group_sizes: pd.Series) -> pd.DataFrame:
         """
         Apply suppression to ensure k-anonymity.
 
+        The DataFrame is modified in place; callers are expected to pass the
+        working copy created by `anonymize`.
+
         Args:
             df (pd.DataFrame): The DataFrame to modify
             quasi_identifiers (List[str]): List of quasi-identifier columns
+            group_sizes (pd.Series): Equivalence class sizes of df as returned by `_group_sizes`
 
         Returns:
             pd.DataFrame: DataFrame with suppressed records to ensure k-anonymity
         """
-        result_df = df.copy()
-
-        # Count occurrences of each quasi-identifier combination
-        combination_counts = df.groupby(quasi_identifiers).size().reset_index(name='count')
-
         # Identify combinations that violate k-anonymity
-        violating_combinations = combination_counts[combination_counts['count'] < self.k]
+        violating_combinations = group_sizes.index[group_sizes < self.k]
 
         if len(violating_combinations) > 0:
-            # Create a mask for records that violate k-anonymity
-            mask = pd.Series(False, index=df.index)
-
-            for _, row in violating_combinations.iterrows():
-                # Create a condition to match this specific combination
-                condition = pd.Series(True, index=df.index)
-                for col in quasi_identifiers:
-                    condition &= (df[col] == row[col])
-
-                # Add these records to the mask
-                mask |= condition
+            # Records whose quasi-identifier combination is one of the violating ones
+            mask = df.set_index(quasi_identifiers).index.isin(violating_combinations)
 
             # Suppress quasi-identifiers for violating records
-            for col in quasi_identifiers:
-                result_df.loc[mask, col] = None
+            df.loc[mask, quasi_identifiers] = None
 
-        return result_df
+        return df
 
     def evaluate_information_loss(self, 
                                 original_df: pd.DataFrame, 
@@ -267,27 +314,31 @@ class KAnonymity:
         """
         metrics = {}
 
+        # Count suppressed (null) values of every quasi-identifier in one pass
+        null_counts = anonymized_df[quasi_identifiers].isna().sum()
+
         # Calculate suppression rate (percentage of suppressed values)
         for col in quasi_identifiers:
-            null_count = anonymized_df[col].isna().sum()
-            metrics[f"{col}_suppression_rate"] = null_count / len(anonymized_df) * 100
+            metrics[f"{col}_suppression_rate"] = null_counts[col] / len(anonymized_df) * 100
 
         # Calculate overall suppression rate
         total_cells = len(anonymized_df) * len(quasi_identifiers)
-        total_suppressed = sum(anonymized_df[col].isna().sum() for col in quasi_identifiers)
+        total_suppressed = int(null_counts.sum())
         metrics["overall_suppression_rate"] = total_suppressed / total_cells * 100
 
         # Calculate generalization impact for numerical columns
+        original_numeric = original_df.dtypes[quasi_identifiers].map(pd.api.types.is_numeric_dtype)
+        anonymized_numeric = anonymized_df.dtypes[quasi_identifiers].map(pd.api.types.is_numeric_dtype)
         for col in quasi_identifiers:
-            if pd.api.types.is_numeric_dtype(original_df[col]):
+            if original_numeric[col]:
                 # If binning was applied, calculate average bin size
-                if not pd.api.types.is_numeric_dtype(anonymized_df[col]):
+                if not anonymized_numeric[col]:
                     metrics[f"{col}_avg_generalization"] = (
                         original_df[col].max() - original_df[col].min()
                     ) / anonymized_df[col].nunique()
 
         # Calculate equivalence class statistics
-        ec_sizes = anonymized_df.groupby(quasi_identifiers).size()
+        ec_sizes = anonymized_df.groupby(quasi_identifiers, observed=True).size()
         metrics["equivalence_class_count"] = len(ec_sizes)
         metrics["avg_equivalence_class_size"] = ec_sizes.mean()
 
@@ -7,7 +7,8 @@ from wipekit.logging.logger import (
     configure_logger,
     LogLevel,
     LogFormat,
-    LogHandler
+    LogHandler,
+    iter_msgpack_log
 )
 
 __all__ = [
@@ -15,5 +16,6 @@ __all__ = [
     'configure_logger',
     'LogLevel',
     'LogFormat',
-    'LogHandler'
+    'LogHandler',
+    'iter_msgpack_log'
 ]
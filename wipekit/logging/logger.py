@@ -6,7 +6,7 @@
 
 This module provides a robust, configurable logging system for enterprise applications. 
 Features include:
-- Multiple output formats (text, JSON)
+- Multiple output formats (text, JSON, flat JSON, compact, binary MessagePack)
 - Flexible logging handlers (console, file, rotating file, syslog)
 - Log level management per module
 - Structured logging support
@@ -26,21 +26,45 @@ Example:
 import os
 import sys
 import json
+import time
+import queue
+import atexit
 import logging
-import datetime
+import weakref
+import threading
 import traceback
-from enum import Enum
-from typing import Dict, Any, Optional, Union, List, Callable
-from logging.handlers import RotatingFileHandler, SysLogHandler, TimedRotatingFileHandler
+from enum import Enum, IntEnum
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Optional, Union, List, Callable, Mapping, Sequence
+from logging.handlers import (
+    RotatingFileHandler, SysLogHandler, TimedRotatingFileHandler, QueueHandler, QueueListener,
+    MemoryHandler
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 # Singleton registry to store loggers
 _LOGGERS = {}
+# Serializes logger creation; lookups of existing loggers do not take it
+_LOGGERS_LOCK = threading.Lock()
 # Global configuration
 _GLOBAL_CONFIG = {}
 
 
-class LogLevel(Enum):
-    """Standard log levels with clear semantics for enterprise applications."""
+class LogLevel(IntEnum):
+    """Standard log levels with clear semantics for enterprise applications.
+
+    Members are ints equal to the logging module's levels, so they compare with record
+    levels and can be passed to logging APIs such as Logger.setLevel as they are.
+    """
     DEBUG = logging.DEBUG
     INFO = logging.INFO
     WARNING = logging.WARNING
@@ -52,7 +76,9 @@ class LogFormat(Enum):
     """Available log format styles."""
     TEXT = "text"  # Human-readable text format
     JSON = "json"  # Structured JSON format for machine processing
+    JSON_FLAT = "json_flat"  # Single-level JSON with short keys, one object per line
     COMPACT = "compact"  # Minimalist format for space efficiency
+    MSGPACK = "msgpack"  # Length-prefixed MessagePack frames for log files (requires msgpack)
 
 
 class LogHandler(Enum):
@@ -64,106 +90,935 @@ class LogHandler(Enum):
     SYSLOG = "syslog"
 
 
+# Handler types that write to log_file
+_FILE_HANDLERS = frozenset((LogHandler.FILE, LogHandler.ROTATING_FILE, LogHandler.TIMED_ROTATING_FILE))
+
+
+def _json_dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log record dict, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data)
+
+
+def _json_dumps_bytes(data: Dict[str, Any]) -> bytes:
+    """Serialize a log record dict to UTF-8 JSON bytes, skipping orjson's str decode."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode("utf-8")
+
+
 class JsonFormatter(logging.Formatter):
     """JSON log formatter for structured logging and machine readability."""
 
+    __slots__ = ("include_timestamp", "_ts_cache")
+
     def __init__(self, include_timestamp: bool = True):
         super().__init__()
         self.include_timestamp = include_timestamp
+        # (second, text) of the last formatted second, reused for every record logged
+        # within it; kept as one tuple so handlers sharing the formatter never see a torn pair
+        self._ts_cache = (-1, "")
 
     def format(self, record):
+        return _json_dumps(self._record_data(record))
+
+    def format_bytes(self, record) -> bytes:
+        """Format a record as UTF-8 encoded JSON, for handlers that write bytes."""
+        return _json_dumps_bytes(self._record_data(record))
+
+    def _record_data(self, record) -> Dict[str, Any]:
+        """Build the JSON document for a record."""
+        # Plain string messages without arguments need no interpolation
         log_data = {
             "level": record.levelname,
             "name": record.name,
-            "message": record.getMessage(),
+            "message": record.msg if not record.args and type(record.msg) is str else record.getMessage(),
         }
 
-        # Add timestamp if requested
+        # Add timestamp if requested (ISO 8601, local time, microsecond precision)
         if self.include_timestamp:
-            log_data["timestamp"] = datetime.datetime.fromtimestamp(
-                record.created
-            ).isoformat()
+            log_data["timestamp"] = self._timestamp(record.created)
+
+        # Plain records carry nothing else
+        extra = getattr(record, "_extra", None)
+        if not record.exc_info and not extra:
+            return log_data
 
-        # Add exception info if present
+        # Add exception info if present, reusing the traceback text cached on the record
         if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
             log_data["exception"] = {
                 "type": record.exc_info[0].__name__,
                 "message": str(record.exc_info[1]),
-                "traceback": traceback.format_exception(*record.exc_info)
+                "traceback": record.exc_text
             }
 
         # Add extra fields from the record
-        if hasattr(record, "_extra") and record._extra:
-            log_data["data"] = record._extra
+        if extra:
+            log_data["data"] = extra
+
+        return log_data
+
+    def _timestamp(self, created: float) -> str:
+        """Format a record's creation time, reusing the cached string for the current second."""
+        sec = int(created)
+        cached_sec, text = self._ts_cache
+        if sec != cached_sec:
+            text = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+            self._ts_cache = (sec, text)
+        return "%s.%06d" % (text, (created - sec) * 1_000_000)
+
+
+class JsonFlatFormatter(JsonFormatter):
+    """JSON log formatter that writes every field at the top level of the record.
+
+    Schema: ts, lvl, name, msg, file, line, func, pid, tid, plus exc_type, exc_msg and
+    exc_tb for exceptions. Extra data is merged in as top-level keys; keys that clash
+    with the fields above are dropped. A fixed, flat key set compresses much better
+    in columnar log stores than the nested JSON format.
+    """
+
+    __slots__ = ("_pid", "_tid")
+
+    def __init__(self, include_timestamp: bool = True):
+        super().__init__(include_timestamp=include_timestamp)
+        # Fallbacks for records created with logging.logProcesses/logThreads disabled
+        self._pid = os.getpid()
+        self._tid = threading.get_ident()
+
+    def _record_data(self, record) -> Dict[str, Any]:
+        log_data = {}
+        if self.include_timestamp:
+            log_data["ts"] = self._timestamp(record.created)
+        log_data["lvl"] = record.levelname
+        log_data["name"] = record.name
+        log_data["msg"] = record.msg if not record.args and type(record.msg) is str else record.getMessage()
+        log_data["file"] = record.filename
+        log_data["line"] = record.lineno
+        log_data["func"] = record.funcName
+        log_data["pid"] = record.process if record.process is not None else self._pid
+        log_data["tid"] = record.thread if record.thread is not None else self._tid
+
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_data["exc_type"] = record.exc_info[0].__name__
+            log_data["exc_msg"] = str(record.exc_info[1])
+            log_data["exc_tb"] = record.exc_text
+
+        extra = getattr(record, "_extra", None)
+        if extra:
+            for key, value in extra.items():
+                log_data.setdefault(key, value)
+
+        return log_data
+
+
+class MsgpackFormatter(JsonFlatFormatter):
+    """Binary log formatter writing each record as a length-prefixed MessagePack frame.
+
+    Records have the JSON_FLAT schema, except that ts is the creation time in seconds
+    since the epoch (a float). Each frame is a 4-byte little-endian payload size followed
+    by the payload; read files back with iter_msgpack_log (msgpack.Unpacker on its own
+    would decode the size prefixes as integers). format() returns bytes and is meant for the binary file handlers configure_logger
+    installs for this format; values msgpack cannot encode are written as str().
+    """
+
+    __slots__ = ()
+
+    def __init__(self, include_timestamp: bool = True):
+        if msgpack is None:
+            raise ImportError("msgpack is required for LogFormat.MSGPACK. "
+                              "Install it with: pip install msgpack")
+        super().__init__(include_timestamp=include_timestamp)
+
+    def format(self, record) -> bytes:
+        return self.format_bytes(record)
+
+    def format_bytes(self, record) -> bytes:
+        """Format a record as one length-prefixed MessagePack frame."""
+        payload = msgpack.packb(self._record_data(record), use_bin_type=True, default=str)
+        return len(payload).to_bytes(4, "little") + payload
+
+    def _timestamp(self, created: float) -> float:
+        return created
 
-        return json.dumps(log_data)
+
+def iter_msgpack_log(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a log file written with LogFormat.MSGPACK, in order.
+
+    Reading stops at a truncated final frame, such as one still being written.
+
+    Args:
+        path: Path to the log file
+
+    Raises:
+        ImportError: If msgpack is not installed
+    """
+    if msgpack is None:
+        raise ImportError("msgpack is required to read LogFormat.MSGPACK logs. "
+                          "Install it with: pip install msgpack")
+    with open(path, "rb") as f:
+        while True:
+            header = f.read(4)
+            if len(header) < 4:
+                return
+            size = int.from_bytes(header, "little")
+            payload = f.read(size)
+            if len(payload) < size:
+                return
+            yield msgpack.unpackb(payload, raw=False)
+
+
+# Single-letter level codes used by the compact format
+_LEVEL_LETTERS = {
+    logging.DEBUG: "D",
+    logging.INFO: "I",
+    logging.WARNING: "W",
+    logging.ERROR: "E",
+    logging.CRITICAL: "C",
+}
 
 
 class CompactFormatter(logging.Formatter):
     """Compact log formatter for minimal log size while retaining readability."""
 
+    __slots__ = ("include_timestamp", "_ts_cache")
+
     def __init__(self, include_timestamp: bool = True):
         super().__init__()
         self.include_timestamp = include_timestamp
+        # (second, text) of the last formatted second, reused for every record logged
+        # within it; kept as one tuple so handlers sharing the formatter never see a torn pair
+        self._ts_cache = (-1, "")
+        # Resolve the timestamp choice once instead of on every record
+        self.format = self._format_with_ts if include_timestamp else self._format_no_ts
 
     def format(self, record):
-        timestamp = datetime.datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S") if self.include_timestamp else ""
-        prefix = f"{timestamp} {record.levelname[0]} " if timestamp else f"{record.levelname[0]} "
-
-        msg = f"{prefix}{record.name}: {record.getMessage()}"
+        if self.include_timestamp:
+            return self._format_with_ts(record)
+        return self._format_no_ts(record)
+
+    def _format_with_ts(self, record):
+        sec = int(record.created)
+        cached_sec, timestamp = self._ts_cache
+        if sec != cached_sec:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            self._ts_cache = (sec, timestamp)
+        level = _LEVEL_LETTERS.get(record.levelno) or record.levelname[:1]
+        message = record.msg if not record.args and type(record.msg) is str else record.getMessage()
+        msg = f"{timestamp} {level} {record.name}: {message}"
+        if record.exc_info:
+            msg += self._exception_suffix(record.exc_info)
+        return msg
 
-        # Add exception info if present
+    def _format_no_ts(self, record):
+        level = _LEVEL_LETTERS.get(record.levelno) or record.levelname[:1]
+        message = record.msg if not record.args and type(record.msg) is str else record.getMessage()
+        msg = f"{level} {record.name}: {message}"
         if record.exc_info:
-            exception_msg = traceback.format_exception_only(record.exc_info[0], record.exc_info[1])[0].strip()
-            msg += f" | {exception_msg}"
+            msg += self._exception_suffix(record.exc_info)
+        return msg
+
+    @staticmethod
+    def _exception_suffix(exc_info) -> str:
+        """Summarize an exception as a one-line suffix."""
+        exception_msg = traceback.format_exception_only(exc_info[0], exc_info[1])[0].strip()
+        return f" | {exception_msg}"
+
+
+# Layouts of the text format; TextFormatter produces exactly these lines
+_TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s (%(filename)s:%(lineno)d): %(message)s"
+_TEXT_FORMAT_NO_TS = "[%(levelname)s] %(name)s: %(message)s"
+_TEXT_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable text formatter with the layout built in.
+
+    Produces the same lines as a logging.Formatter with the text format string, but
+    assembles them with an f-string instead of %-substituting the record's __dict__, and
+    formats the timestamp once per second instead of calling strftime for every record.
+    Exceptions and stack information are appended as by logging.Formatter.
+    """
+
+    __slots__ = ("include_timestamp", "_ts_cache")
+
+    def __init__(self, include_timestamp: bool = True):
+        super().__init__(_TEXT_FORMAT if include_timestamp else _TEXT_FORMAT_NO_TS,
+                         _TEXT_DATEFMT, validate=False)
+        self.include_timestamp = include_timestamp
+        # (second, text) of the last formatted second; one tuple so it is never torn
+        self._ts_cache = (-1, "")
+        # Resolve the timestamp choice once instead of on every record
+        self.format = self._format_with_ts if include_timestamp else self._format_no_ts
+
+    def format(self, record):
+        if self.include_timestamp:
+            return self._format_with_ts(record)
+        return self._format_no_ts(record)
+
+    def _format_with_ts(self, record):
+        sec = int(record.created)
+        cached_sec, timestamp = self._ts_cache
+        if sec != cached_sec:
+            timestamp = time.strftime(_TEXT_DATEFMT, self.converter(sec))
+            self._ts_cache = (sec, timestamp)
+        message = record.msg if not record.args and type(record.msg) is str else record.getMessage()
+        msg = (f"{timestamp} [{record.levelname}] {record.name} "
+               f"({record.filename}:{record.lineno}): {message}")
+        if record.exc_info or record.exc_text or record.stack_info:
+            msg = self._append_traceback(record, msg)
+        return msg
+
+    def _format_no_ts(self, record):
+        message = record.msg if not record.args and type(record.msg) is str else record.getMessage()
+        msg = f"[{record.levelname}] {record.name}: {message}"
+        if record.exc_info or record.exc_text or record.stack_info:
+            msg = self._append_traceback(record, msg)
+        return msg
+
+    def _append_traceback(self, record, msg: str) -> str:
+        """Append exception and stack text the way logging.Formatter.format does."""
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if msg[-1:] != "\n":
+                msg += "\n"
+            msg += record.exc_text
+        if record.stack_info:
+            if msg[-1:] != "\n":
+                msg += "\n"
+            msg += self.formatStack(record.stack_info)
+        return msg
+
+
+class BytesStreamHandler(logging.StreamHandler):
+    """Stream handler that writes encoded records straight to the stream's binary buffer.
+
+    With the JSON formatters the serialized bytes from orjson are written as-is, skipping
+    the decode to str and the re-encode in the text layer; other formatters' output is
+    encoded as UTF-8. Streams without a binary buffer fall back to text writes. Text
+    written to the same stream by other means should be flushed first to keep ordering.
+    """
+
+    def emit(self, record):
+        buffer = getattr(self.stream, "buffer", None)
+        if buffer is None:
+            return super().emit(record)
+        try:
+            format_bytes = getattr(self.formatter, "format_bytes", None)
+            if format_bytes is not None:
+                data = format_bytes(record)
+            else:
+                data = self.format(record).encode("utf-8")
+            buffer.write(data + b"\n")
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            buffer = getattr(self.stream, "buffer", None)
+            if buffer is not None:
+                buffer.flush()
+            elif self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+        finally:
+            self.release()
+
+
+class _BatchFlushMixin:
+    """Stream handler mixin that lets a batch writer skip the flush after every record.
+
+    While _batch_thread holds the ident of the thread writing a batch (a queue listener
+    or a BatchingHandler), that thread's flush() calls are skipped, and the writer
+    flushes once when the batch is done. flush() from any other thread goes through.
+    """
+
+    _batch_thread: Optional[int] = None
+
+    def flush(self):
+        if self._batch_thread != threading.get_ident():
+            super().flush()
+
+
+@lru_cache(maxsize=None)
+def _batch_flush_class(handler_cls: type) -> type:
+    """Variant of a stream handler class with _BatchFlushMixin, created once per class."""
+    return type(handler_cls.__name__, (_BatchFlushMixin, handler_cls), {})
+
+
+# File handlers flushed by the background flusher thread, mapped to
+# (flush interval, next flush time on the monotonic clock), and the thread's state
+_INTERVAL_FLUSH_HANDLERS = weakref.WeakKeyDictionary()
+_INTERVAL_FLUSH_WAKE = threading.Condition()
+_INTERVAL_FLUSH_STOP = threading.Event()
+_interval_flush_thread: Optional[threading.Thread] = None
+
+
+def _due_interval_flushes(now: float):
+    """Return the handlers due for a flush at now, rescheduled, and the next due time.
+
+    Called with _INTERVAL_FLUSH_WAKE held. The next due time is None when no handler
+    is registered.
+    """
+    due = []
+    next_due = None
+    for handler, (interval, handler_due) in list(_INTERVAL_FLUSH_HANDLERS.items()):
+        if handler_due <= now:
+            due.append(handler)
+            handler_due = now + interval
+            _INTERVAL_FLUSH_HANDLERS[handler] = (interval, handler_due)
+        if next_due is None or handler_due < next_due:
+            next_due = handler_due
+    return due, next_due
+
+
+def _interval_flush_loop() -> None:
+    """Flush each registered handler every flush_interval seconds of its own until stopped."""
+    while True:
+        with _INTERVAL_FLUSH_WAKE:
+            if _INTERVAL_FLUSH_STOP.is_set():
+                return
+            now = time.monotonic()
+            due, next_due = _due_interval_flushes(now)
+            if not due:
+                # Woken early by a new registration or by _stop_interval_flush
+                _INTERVAL_FLUSH_WAKE.wait(None if next_due is None else next_due - now)
+                continue
+        for handler in due:
+            handler.flush()
+        # Don't keep a closed handler alive while waiting, the registry only holds weak refs
+        del due, handler
+
+
+def _register_interval_flush(handler: logging.Handler, interval: float) -> None:
+    """Have the flusher thread flush handler every interval seconds, starting it if needed."""
+    global _interval_flush_thread
+    with _INTERVAL_FLUSH_WAKE:
+        _INTERVAL_FLUSH_HANDLERS[handler] = (interval, time.monotonic() + interval)
+        _INTERVAL_FLUSH_WAKE.notify()
+        if _interval_flush_thread is None or not _interval_flush_thread.is_alive():
+            _INTERVAL_FLUSH_STOP.clear()
+            _interval_flush_thread = threading.Thread(
+                target=_interval_flush_loop, name="wipekit-log-flusher", daemon=True)
+            _interval_flush_thread.start()
+
+
+def _stop_interval_flush() -> None:
+    """Stop the flusher thread and flush the registered handlers one last time."""
+    with _INTERVAL_FLUSH_WAKE:
+        _INTERVAL_FLUSH_STOP.set()
+        _INTERVAL_FLUSH_WAKE.notify()
+    if _interval_flush_thread is not None:
+        _interval_flush_thread.join()
+    for handler in list(_INTERVAL_FLUSH_HANDLERS):
+        handler.flush()
+
+
+atexit.register(_stop_interval_flush)
+
+
+class _IntervalFlushMixin:
+    """File handler mixin that buffers writes and flushes on a timer.
+
+    The file is opened with a 64 KB buffer and the flush after every record is skipped,
+    so records reach the file in large writes; the background flusher thread flushes
+    each handler every flush_interval seconds of its own, and close() and rollover
+    flush as usual.
+    """
+
+    buffer_size = 64 * 1024
+
+    def __init__(self, *args, flush_interval: float = 1.0, **kwargs):
+        self._emitting = False
+        super().__init__(*args, **kwargs)
+        _register_interval_flush(self, flush_interval)
+
+    def _open(self):
+        # FileHandler has no errors attribute before Python 3.9
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=getattr(self, "errors", None))
+
+    def emit(self, record):
+        # Runs under the handler lock; StreamHandler.emit's flush() is skipped
+        self._emitting = True
+        try:
+            super().emit(record)
+        finally:
+            self._emitting = False
+
+    def flush(self):
+        if not self._emitting:
+            super().flush()
+
+
+class BufferedFileHandler(_IntervalFlushMixin, logging.FileHandler):
+    """FileHandler writing through a 64 KB buffer flushed every flush_interval seconds."""
 
+
+class BufferedRotatingFileHandler(_IntervalFlushMixin, RotatingFileHandler):
+    """RotatingFileHandler writing through a 64 KB buffer flushed every flush_interval seconds.
+
+    The stdlib size check seeks the stream before every record, which would flush the
+    buffer each time; here the size is counted from the text written instead (in
+    characters, so it equals bytes for ASCII logs). The file rolls over before the first
+    record after it has reached maxBytes.
+    """
+
+    def _open(self):
+        stream = super()._open()
+        self._written = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        return 0 < self.maxBytes <= self._written
+
+    def format(self, record):
+        # Called once per record by emit, right before the message is written
+        msg = super().format(record)
+        self._written += len(msg) + len(self.terminator)
         return msg
 
 
-class WipekitLogger(logging.Logger):
-    """Enhanced logger with additional enterprise features."""
+class BufferedTimedRotatingFileHandler(_IntervalFlushMixin, TimedRotatingFileHandler):
+    """TimedRotatingFileHandler writing through a 64 KB buffer flushed every flush_interval seconds."""
+
+
+class OpenTimeRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that checks the file size only when the file is opened.
 
-    def __init__(self, name, level=logging.NOTSET):
-        super().__init__(name, level)
+    Records are written without a per-record size check (the stdlib handler seeks the
+    stream and formats each record twice for it). The file is rolled over when it is
+    opened at maxBytes or more: on the first record, after reopen(), and when a record
+    arrives check_interval seconds after the last open, which reopens the file. A file
+    can therefore grow past maxBytes by up to check_interval seconds of records.
+    reopen() can be called from a SIGHUP handler to rotate on demand.
+    """
+
+    def __init__(self, filename, mode="a", maxBytes=0, backupCount=0, encoding=None,
+                 delay=False, errors=None, check_interval: float = 60.0):
+        self.check_interval = check_interval
+        self._next_check = 0.0  # the first record checks the size
+        # RotatingFileHandler takes errors only on Python 3.9+
+        kwargs = {"errors": errors} if errors is not None else {}
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay, **kwargs)
+
+    def shouldRollover(self, record):
+        return False
+
+    def emit(self, record):
+        # Runs under the handler lock
+        if self.stream is not None and time.monotonic() >= self._next_check:
+            self.stream.close()
+            self.stream = None
+        if self.stream is None:
+            self._rollover_if_full()
+            self._next_check = time.monotonic() + self.check_interval
+        logging.FileHandler.emit(self, record)
+
+    def reopen(self) -> None:
+        """Close the file so that the next record reopens it, rolling it over if full."""
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+        finally:
+            self.release()
+
+    def _rollover_if_full(self) -> None:
+        if self.maxBytes <= 0 or self.backupCount <= 0:
+            return
+        try:
+            if os.path.getsize(self.baseFilename) < self.maxBytes:
+                return
+        except OSError:  # Not created yet
+            return
+        # Same renames as RotatingFileHandler.doRollover
+        for i in range(self.backupCount - 1, 0, -1):
+            sfn = self.rotation_filename("%s.%d" % (self.baseFilename, i))
+            dfn = self.rotation_filename("%s.%d" % (self.baseFilename, i + 1))
+            if os.path.exists(sfn):
+                if os.path.exists(dfn):
+                    os.remove(dfn)
+                os.rename(sfn, dfn)
+        dfn = self.rotation_filename(self.baseFilename + ".1")
+        if os.path.exists(dfn):
+            os.remove(dfn)
+        self.rotate(self.baseFilename, dfn)
+
+
+class BufferedOpenTimeRotatingFileHandler(_IntervalFlushMixin, OpenTimeRotatingFileHandler):
+    """OpenTimeRotatingFileHandler writing through a 64 KB buffer flushed every flush_interval seconds."""
+
+
+class _BinaryFileMixin:
+    """File handler mixin that opens the file in binary mode for formatters returning bytes.
+
+    Records are written as formatted, without a line terminator. The handler must be
+    created with delay=True so that the file is first opened in binary mode.
+    """
+
+    terminator = b""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The stdlib handlers force text mode for rotation; _open reads these attributes
+        self.mode, self.encoding, self.errors = "ab", None, None
 
-    def _log_with_extra(self, level, msg, args, exc_info=None, extra=None, stack_info=False, stacklevel=1):
-        """Enhanced logging to handle extra data more gracefully for structured logging."""
-        if extra is not None:
+
+def _should_rollover_bytes(self, record) -> bool:
+    """RotatingFileHandler.shouldRollover for records formatted as bytes.
+
+    The stdlib check measures "%s\n" % msg, which for bytes is their much longer repr.
+    """
+    # See bpo-45401: Never rollover anything other than regular files
+    if os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename):
+        return False
+    if self.stream is None:
+        self.stream = self._open()
+    if self.maxBytes > 0:
+        self.stream.seek(0, 2)
+        return self.stream.tell() + len(self.format(record)) >= self.maxBytes
+    return False
+
+
+@lru_cache(maxsize=None)
+def _binary_handler_class(file_cls: type) -> type:
+    """Binary-mode variant of a file handler class, created once per class."""
+    namespace = {}
+    # Size checks of subclasses (counted, or at open time) already work with bytes
+    if getattr(file_cls, "shouldRollover", None) is RotatingFileHandler.shouldRollover:
+        namespace["shouldRollover"] = _should_rollover_bytes
+    return type("Binary" + file_cls.__name__, (_BinaryFileMixin, file_cls), namespace)
+
+
+class WipekitLogger(logging.LoggerAdapter):
+    """Logger adapter that attaches structured data to records for the wipekit formatters.
+
+    Data passed as ``extra`` is stored on the record as ``_extra`` (non-dict values are
+    wrapped as ``{"data": value}``) instead of being spread over record attributes.
+    Level checks, stack levels and caller lookup are handled by the stdlib adapter.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        super().__init__(logger, None)
+
+    def process(self, msg, kwargs):
+        extra = kwargs.get("extra")
+        if extra:
             # Store extra in a dedicated attribute to avoid conflicts
             if not isinstance(extra, dict):
                 extra = {"data": extra}
+            kwargs["extra"] = {"_extra": extra}
+        elif "extra" in kwargs:
+            del kwargs["extra"]
+        return msg, kwargs
+
 
-        # Call standard logger method with properly processed extra data
-        extra_record = {"_extra": extra} if extra else None
-        super()._log(level, msg, args, exc_info, extra_record, stack_info, stacklevel + 1)
+# How a DeferredQueueHandler treats a full bounded queue
+_OVERFLOW_POLICIES = frozenset(("block", "drop_newest", "drop_oldest"))
 
-    def debug(self, msg, *args, **kwargs):
-        """Log a debug message with optional structured data."""
-        self._log_with_extra(logging.DEBUG, msg, args, **kwargs)
 
-    def info(self, msg, *args, **kwargs):
-        """Log an info message with optional structured data."""
-        self._log_with_extra(logging.INFO, msg, args, **kwargs)
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener thread.
 
-    def warning(self, msg, *args, **kwargs):
-        """Log a warning message with optional structured data."""
-        self._log_with_extra(logging.WARNING, msg, args, **kwargs)
+    The stdlib QueueHandler formats each record on the calling thread and strips
+    exc_info; this one only merges the message arguments, so the structured
+    formatters still see the exception and extra data on the listener side.
+
+    When a bounded queue is full, overflow_policy decides what happens: "block" waits
+    for the listener to make room, "drop_newest" discards the new record and
+    "drop_oldest" the oldest queued one. Discarded records are counted, and once the
+    queue has room again a single WARNING "Discarded N log records" record is queued
+    ahead of the next record.
+    """
+
+    def __init__(self, queue, overflow_policy: str = "block"):
+        if overflow_policy not in _OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        super().__init__(queue)
+        self.overflow_policy = overflow_policy
+        # Records discarded since the last summary record
+        self.dropped = 0
+        self._drop_lock = threading.Lock()
+
+    def enqueue(self, record):
+        if self.overflow_policy == "block":
+            # A bounded queue that is full holds the caller back (SimpleQueue never blocks)
+            self.queue.put(record)
+            return
+        if self.dropped:
+            self._enqueue_drop_summary()
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            discarded = record
+        if self.overflow_policy == "drop_oldest":
+            try:
+                discarded = self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                # Raced with other producers; the new record is the one lost
+                discarded = record
+        self._count_dropped(len(discarded) if type(discarded) is list else 1)
+
+    def _count_dropped(self, count: int) -> None:
+        # Taken only once the queue is full; thread-batched handlers enqueue without
+        # holding the handler lock
+        with self._drop_lock:
+            self.dropped += count
+
+    def _enqueue_drop_summary(self, block: bool = False) -> None:
+        """Queue the WARNING record reporting the records discarded so far."""
+        with self._drop_lock:
+            dropped, self.dropped = self.dropped, 0
+        if not dropped:
+            return
+        summary = logging.LogRecord(
+            "wipekit.logging", logging.WARNING, __file__, 0,
+            f"Discarded {dropped} log records: the log queue was full", None, None)
+        try:
+            self.queue.put(summary, block)
+        except queue.Full:
+            self._count_dropped(dropped)
+
+    def prepare(self, record):
+        # Merge args now so later mutation of the arguments cannot change the message
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+class _ThreadBuffer:
+    """Records buffered by one thread for a ThreadLocalBatchHandler."""
+
+    __slots__ = ("thread", "records", "lock")
+
+    def __init__(self, thread: threading.Thread):
+        self.thread = thread
+        self.records = []
+        # Taken by the owning thread and by flush(), so it is only contended during a flush
+        self.lock = threading.Lock()
+
+
+class ThreadLocalBatchHandler(DeferredQueueHandler):
+    """Queue handler that buffers records per thread and enqueues them in batches.
+
+    Each thread appends to its own list under its own buffer lock instead of the shared
+    handler lock; the list is put on the queue as one item when it holds batch_size
+    records or when a record at or above flushLevel arrives. flush() takes each buffer's
+    lock in turn to enqueue what every thread still holds, and is called before the
+    listener stops. Use with a _BatchQueueListener.
+    """
+
+    def __init__(self, queue, batch_size: int = 64, flushLevel: int = logging.WARNING,
+                 overflow_policy: str = "block"):
+        super().__init__(queue, overflow_policy)
+        self.batch_size = batch_size
+        self.flushLevel = flushLevel
+        self._local = threading.local()
+        self._buffers = []
+
+    def _register(self) -> _ThreadBuffer:
+        buffer = self._local.buffer = _ThreadBuffer(threading.current_thread())
+        with self.lock:
+            # Forget drained buffers of threads that have exited
+            self._buffers = [b for b in self._buffers if b.records or b.thread.is_alive()]
+            self._buffers.append(buffer)
+        return buffer
+
+    def handle(self, record):
+        # Same as Handler.handle without the per-record lock
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record):
+        try:
+            try:
+                buffer = self._local.buffer
+            except AttributeError:
+                buffer = self._register()
+            record = self.prepare(record)
+            with buffer.lock:
+                records = buffer.records
+                records.append(record)
+                if len(records) >= self.batch_size or record.levelno >= self.flushLevel:
+                    buffer.records = []
+                    self.enqueue(records)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        with self.lock:
+            for buffer in self._buffers:
+                with buffer.lock:
+                    records, buffer.records = buffer.records, []
+                    if records:
+                        self.enqueue(records)
+
+
+class _RecordBatch(list):
+    """Queue items taken off the queue together by a _QueueListener."""
+
+    __slots__ = ()
+
+
+class _QueueListener(QueueListener):
+    """Queue listener that writes queued records in batches.
+
+    After each blocking get, dequeue() takes up to batch_size - 1 further items already
+    in the queue without waiting. Handlers with _BatchFlushMixin skip their per-record
+    flush while the batch is written and are flushed once after it, so a burst of records
+    reaches the file in a few large writes instead of one write per record.
+    Interval-flushed handlers keep their own flushing. Unlike the stdlib listener, stop()
+    waits for room in a full bounded queue. When core_id is set, the listener thread
+    pins itself to that CPU core (Linux only).
+    """
 
-    def error(self, msg, *args, **kwargs):
-        """Log an error message with optional structured data."""
-        self._log_with_extra(logging.ERROR, msg, args, **kwargs)
+    batch_size = 256
+    core_id: Optional[int] = None
+
+    def __init__(self, queue, *handlers, respect_handler_level: bool = False):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self._pinned = False
+        self._sentinel_pending = False
+
+    def dequeue(self, block):
+        # Runs on the listener thread
+        if not self._pinned:
+            self._pinned = True
+            self._pin()
+        if self._sentinel_pending:
+            self._sentinel_pending = False
+            return self._sentinel
+        item = self.queue.get(block)
+        if item is self._sentinel:
+            return item
+        batch = _RecordBatch((item,))
+        try:
+            while len(batch) < self.batch_size:
+                item = self.queue.get_nowait()
+                if item is self._sentinel:
+                    # Returned by the next call, after this batch is written
+                    self._sentinel_pending = True
+                    break
+                batch.append(item)
+        except queue.Empty:
+            pass
+        # The stdlib loop calls task_done once per dequeue; account for the extra items
+        if hasattr(self.queue, "task_done"):
+            for _ in range(len(batch) - 1):
+                self.queue.task_done()
+        return batch
+
+    def handle(self, item):
+        if len(item) == 1 and type(item[0]) is not list:
+            self._handle_item(item[0])
+            return
+        flushed = [h for h in self.handlers if isinstance(h, _BatchFlushMixin)]
+        ident = threading.get_ident()
+        for handler in flushed:
+            handler._batch_thread = ident
+        try:
+            for record in item:
+                self._handle_item(record)
+        finally:
+            for handler in flushed:
+                handler._batch_thread = None
+                handler.flush()
+
+    def _handle_item(self, record) -> None:
+        """Handle one queued item."""
+        super().handle(record)
+
+    def _pin(self) -> None:
+        """Pin the calling (listener) thread to core_id, if set and supported."""
+        if self.core_id is not None and hasattr(os, "sched_setaffinity"):
+            try:
+                # pid 0 is the calling thread
+                os.sched_setaffinity(0, {self.core_id})
+            except OSError as e:
+                print(f"Could not pin the log listener to core {self.core_id}: {str(e)}",
+                      file=sys.stderr)
+
+    def enqueue_sentinel(self):
+        # The stdlib put_nowait raises queue.Full while a bounded queue is full
+        self.queue.put(self._sentinel)
+
+
+class _BatchQueueListener(_QueueListener):
+    """Queue listener that also accepts lists of records from a ThreadLocalBatchHandler."""
+
+    def _handle_item(self, record) -> None:
+        if type(record) is list:
+            for item in record:
+                super()._handle_item(item)
+        else:
+            super()._handle_item(record)
 
-    def critical(self, msg, *args, **kwargs):
-        """Log a critical message with optional structured data."""
-        self._log_with_extra(logging.CRITICAL, msg, args, **kwargs)
 
-    def exception(self, msg, *args, exc_info=True, **kwargs):
-        """Log an exception with traceback and optional structured data."""
-        self._log_with_extra(logging.ERROR, msg, args, exc_info=exc_info, **kwargs)
+class BatchingHandler(MemoryHandler):
+    """Memory handler that writes its buffered records to the target as one batch.
 
+    A target with _BatchFlushMixin skips its per-record flush while the batch is
+    written, so a full buffer costs a single flush instead of one per record. The buffer is
+    written when it reaches capacity, on records at or above flushLevel, and on close.
+    """
 
-# Register the custom logger class
-logging.setLoggerClass(WipekitLogger)
+    def flush(self):
+        self.acquire()
+        try:
+            if self.target is None or not self.buffer:
+                return
+            target = self.target
+            batching = isinstance(target, _BatchFlushMixin)
+            if batching:
+                target._batch_thread = threading.get_ident()
+            try:
+                for record in self.buffer:
+                    target.handle(record)
+            finally:
+                if batching:
+                    target._batch_thread = None
+            target.flush()
+            self.buffer.clear()
+        finally:
+            self.release()
+
+
+def _stop_listener() -> None:
+    """Stop the background queue listener, flushing any queued records."""
+    listener = _GLOBAL_CONFIG.get("_listener")
+    if listener is not None:
+        for handler in logging.getLogger().handlers:
+            # Hand over records still held in per-thread buffers
+            if isinstance(handler, ThreadLocalBatchHandler):
+                handler.flush()
+            # Report records discarded since the last summary
+            if isinstance(handler, DeferredQueueHandler) and handler.dropped:
+                handler._enqueue_drop_summary(block=True)
+        listener.stop()
+        _GLOBAL_CONFIG["_listener"] = None
+
+
+# Drain the queue before logging.shutdown() closes the handlers
+atexit.register(_stop_listener)
 
 
 def get_formatter(log_format: LogFormat, include_timestamp: bool = True) -> logging.Formatter:
@@ -178,54 +1033,91 @@ def get_formatter(log_format: LogFormat, include_timestamp: bool = True) -> logg
     """
     if log_format == LogFormat.JSON:
         return JsonFormatter(include_timestamp=include_timestamp)
+    elif log_format == LogFormat.JSON_FLAT:
+        return JsonFlatFormatter(include_timestamp=include_timestamp)
     elif log_format == LogFormat.COMPACT:
         return CompactFormatter(include_timestamp=include_timestamp)
+    elif log_format == LogFormat.MSGPACK:
+        return MsgpackFormatter(include_timestamp=include_timestamp)
     else:  # TEXT format (default)
-        if include_timestamp:
-            return logging.Formatter(
-                "%(asctime)s [%(levelname)s] %(name)s (%(filename)s:%(lineno)d): %(message)s",
-                "%Y-%m-%d %H:%M:%S"
-            )
-        else:
-            return logging.Formatter(
-                "[%(levelname)s] %(name)s: %(message)s"
-            )
+        return TextFormatter(include_timestamp=include_timestamp)
 
 
-def configure_handler(handler: logging.Handler, log_format: LogFormat, level: LogLevel) -> None:
+def configure_handler(
+    handler: logging.Handler,
+    log_format: LogFormat,
+    level: LogLevel,
+    formatter: Optional[logging.Formatter] = None
+) -> None:
     """Configure a logging handler with the specified format and level.
 
     Args:
         handler: The handler to configure
         log_format: The format to use for logs
         level: The minimum log level for this handler
+        formatter: Formatter to share with other handlers; built from log_format if omitted
     """
-    formatter = get_formatter(log_format)
+    if formatter is None:
+        formatter = get_formatter(log_format)
     handler.setFormatter(formatter)
     handler.setLevel(level.value)
 
+    # Buffered handlers format and write through their target
+    if isinstance(handler, MemoryHandler) and handler.target is not None:
+        handler.target.setFormatter(formatter)
+        handler.target.setLevel(level.value)
+
+
+def _buffered(handler: logging.Handler, capacity: int) -> logging.Handler:
+    """Wrap a file handler in a BatchingHandler when a positive buffer capacity is given."""
+    if capacity > 0:
+        return BatchingHandler(capacity, flushLevel=logging.ERROR, target=handler, flushOnClose=True)
+    return handler
+
 
 def create_handler(handler_type: LogHandler, **kwargs) -> Optional[logging.Handler]:
     """Create and configure a log handler of the specified type.
 
+    File handlers open their file lazily on the first record and expect its directory
+    to exist; configure_logger creates it.
+
     Args:
         handler_type: The type of handler to create
-        **kwargs: Additional configuration options for the handler
+        **kwargs: Additional configuration options for the handler. File handlers accept
+            buffer_capacity: when positive, records are buffered in memory and written in batches
+            of that size (errors and above are written immediately).
+            rotation_strategy: for the rotating file handler, "size" checks the size on
+            every record, "open_time" only when the file is opened (see
+            OpenTimeRotatingFileHandler).
+            flush_interval: when positive, files are written through a 64 KB buffer that a
+            background thread flushes every flush_interval seconds, instead of being
+            flushed after every record.
+            binary: open the file in binary mode, for formatters that return bytes
+            (LogFormat.MSGPACK).
+            The console handler accepts bytes_mode: when true, records are written as bytes
+            to the binary buffer of stdout (see BytesStreamHandler).
 
     Returns:
         A configured handler or None if creation failed
     """
+    buffer_capacity = kwargs.get("buffer_capacity", 0)
+    flush_interval = kwargs.get("flush_interval", 0)
+    # Interval-flushed handlers take the interval as an extra keyword argument
+    timed = {"flush_interval": flush_interval} if flush_interval > 0 else {}
+    binary = kwargs.get("binary", False)
     try:
         if handler_type == LogHandler.CONSOLE:
-            return logging.StreamHandler(sys.stdout)
+            console_cls = BytesStreamHandler if kwargs.get("bytes_mode") else logging.StreamHandler
+            return _batch_flush_class(console_cls)(sys.stdout)
 
         elif handler_type == LogHandler.FILE:
             log_file = kwargs.get("log_file")
             if not log_file:
                 raise ValueError("log_file parameter is required for FILE handler")
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
-            return logging.FileHandler(log_file)
+            file_cls = BufferedFileHandler if timed else _batch_flush_class(logging.FileHandler)
+            if binary:
+                file_cls = _binary_handler_class(file_cls)
+            return _buffered(file_cls(log_file, delay=True, **timed), buffer_capacity)
 
         elif handler_type == LogHandler.ROTATING_FILE:
             log_file = kwargs.get("log_file")
@@ -233,11 +1125,20 @@ def create_handler(handler_type: LogHandler, **kwargs) -> Optional[logging.Handl
             backup_count = kwargs.get("backup_count", 5)
             if not log_file:
                 raise ValueError("log_file parameter is required for ROTATING_FILE handler")
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
-            return RotatingFileHandler(
-                log_file, maxBytes=max_bytes, backupCount=backup_count
-            )
+            rotation_strategy = kwargs.get("rotation_strategy", "size")
+            if rotation_strategy == "open_time":
+                file_cls = (BufferedOpenTimeRotatingFileHandler if timed
+                            else _batch_flush_class(OpenTimeRotatingFileHandler))
+            elif rotation_strategy == "size":
+                file_cls = (BufferedRotatingFileHandler if timed
+                            else _batch_flush_class(RotatingFileHandler))
+            else:
+                raise ValueError(f"Unknown rotation strategy: {rotation_strategy}")
+            if binary:
+                file_cls = _binary_handler_class(file_cls)
+            return _buffered(file_cls(
+                log_file, maxBytes=max_bytes, backupCount=backup_count, delay=True, **timed
+            ), buffer_capacity)
 
         elif handler_type == LogHandler.TIMED_ROTATING_FILE:
             log_file = kwargs.get("log_file")
@@ -246,11 +1147,14 @@ def create_handler(handler_type: LogHandler, **kwargs) -> Optional[logging.Handl
             backup_count = kwargs.get("backup_count", 7)  # Keep a week of logs by default
             if not log_file:
                 raise ValueError("log_file parameter is required for TIMED_ROTATING_FILE handler")
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
-            return TimedRotatingFileHandler(
-                log_file, when=when, interval=interval, backupCount=backup_count
-            )
+            file_cls = (BufferedTimedRotatingFileHandler if timed
+                        else _batch_flush_class(TimedRotatingFileHandler))
+            if binary:
+                file_cls = _binary_handler_class(file_cls)
+            return _buffered(file_cls(
+                log_file, when=when, interval=interval, backupCount=backup_count, delay=True,
+                **timed
+            ), buffer_capacity)
 
         elif handler_type == LogHandler.SYSLOG:
             address = kwargs.get("address", "/dev/log")
@@ -269,12 +1173,23 @@ def create_handler(handler_type: LogHandler, **kwargs) -> Optional[logging.Handl
 def configure_logger(
     level: LogLevel = LogLevel.INFO,
     format: LogFormat = LogFormat.TEXT,
-    handlers: Optional[List[LogHandler]] = None,
+    handlers: Optional[Sequence[LogHandler]] = None,
     log_file: Optional[str] = None,
     rotation: bool = False,
     max_bytes: int = 10 * 1024 * 1024,  # 10 MB
     backup_count: int = 5,
-    module_levels: Optional[Dict[str, LogLevel]] = None,
+    module_levels: Optional[Mapping[str, LogLevel]] = None,
+    async_logging: bool = False,
+    buffer_capacity: int = 0,
+    single_thread: bool = False,
+    thread_batching: bool = False,
+    bytes_mode: bool = False,
+    queue_size: int = 0,
+    flush_interval: float = 0,
+    rotation_strategy: str = "size",
+    console_format: Optional[LogFormat] = None,
+    overflow_policy: str = "block",
+    listener_core_id: Optional[int] = None,
 ) -> None:
     """Configure the global logging settings for the application.
 
@@ -284,19 +1199,73 @@ def configure_logger(
     Args:
         level: The default log level for all loggers
         format: The format to use for log messages
-        handlers: List of handlers to install (defaults to console only)
+        handlers: Handlers to install, as a list or tuple (defaults to console only)
         log_file: Path to the log file (required for file-based handlers)
         rotation: Whether to use rotating file handler instead of basic file handler
         max_bytes: Maximum file size before rotation (for rotating handler)
         backup_count: Number of backup files to keep (for rotating handler)
-        module_levels: Dictionary mapping module names to specific log levels
+        module_levels: Mapping of module names to specific log levels
+        async_logging: Whether to format and write records on a background thread. The root
+            logger then only enqueues records, and a QueueListener feeds the configured handlers.
+        buffer_capacity: Number of records file handlers buffer in memory before writing them
+            as one batch (0 disables buffering). Errors and above are written immediately.
+        single_thread: Declare the application single-threaded and single-process. Records
+            then skip the thread and process lookups (logging.logThreads, logProcesses and
+            logMultiprocessing are turned off); formatters fall back to ids captured once.
+        thread_batching: With async_logging, buffer records per thread and enqueue them in
+            batches of 64, avoiding the handler lock on every record. Warnings and above
+            enqueue the batch immediately; the rest may wait until the batch fills or the
+            listener stops.
+        bytes_mode: Write console records as bytes to the binary buffer of stdout. With the
+            JSON formats this skips the str round-trip of the orjson output.
+        queue_size: With async_logging, the maximum number of records (or thread batches)
+            waiting for the listener thread; 0 means unbounded. When the queue is full,
+            logging calls block until the listener catches up, so records are not lost,
+            unless overflow_policy says otherwise.
+        flush_interval: Seconds between flushes of file handlers, which then write through a
+            64 KB buffer instead of flushing every record; 0 flushes every record. Records
+            not yet flushed are written on shutdown.
+        rotation_strategy: How the rotating file handler decides to roll over: "size" checks
+            the file size on every record, "open_time" only when the file is (re)opened,
+            at most every 60 seconds, so files may briefly exceed max_bytes.
+        console_format: Format for the console and syslog handlers; defaults to format.
+            Only file handlers write LogFormat.MSGPACK; the others use JSON instead. When
+            msgpack is not installed, files are written as JSON lines too.
+        overflow_policy: What logging calls do when the bounded async queue is full:
+            "block" until there is room, or discard records without waiting, either the
+            new one ("drop_newest") or the oldest queued one ("drop_oldest"). The number
+            of discarded records is logged as a warning once the queue has room again.
+        listener_core_id: With async_logging, a CPU core to pin the listener thread to, so
+            that formatting and I/O stay off the cores running the application (Linux
+            only; ignored elsewhere).
     """
+    global _GLOBAL_CONFIG
+
+    if overflow_policy not in _OVERFLOW_POLICIES:
+        raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+
     # Set default handlers if none provided
     if handlers is None:
         handlers = [LogHandler.CONSOLE]
 
+    # Binary logs need msgpack; fall back to the JSON format without it
+    if format == LogFormat.MSGPACK and msgpack is None:
+        format = LogFormat.JSON
+    # Only file handlers can write binary records
+    if console_format is None:
+        console_format = format
+    if console_format == LogFormat.MSGPACK:
+        console_format = LogFormat.JSON
+
+    # Stop the listener of a previous async configuration before replacing it
+    _stop_listener()
+
+    # Skip per-record thread/process lookups in LogRecord, restoring them if an earlier
+    # configuration turned them off
+    if single_thread or _GLOBAL_CONFIG.get("single_thread"):
+        logging.logThreads = logging.logProcesses = logging.logMultiprocessing = not single_thread
+
     # Store configuration for future loggers
-    global _GLOBAL_CONFIG
     _GLOBAL_CONFIG = {
         "level": level,
         "format": format,
@@ -305,7 +1274,19 @@ def configure_logger(
         "rotation": rotation,
         "max_bytes": max_bytes,
         "backup_count": backup_count,
-        "module_levels": module_levels or {}
+        "module_levels": module_levels or {},
+        "async_logging": async_logging,
+        "buffer_capacity": buffer_capacity,
+        "single_thread": single_thread,
+        "thread_batching": thread_batching,
+        "bytes_mode": bytes_mode,
+        "queue_size": queue_size,
+        "flush_interval": flush_interval,
+        "rotation_strategy": rotation_strategy,
+        "console_format": console_format,
+        "overflow_policy": overflow_policy,
+        "listener_core_id": listener_core_id,
+        "_listener": None
     }
 
     # Configure root logger
@@ -316,16 +1297,28 @@ def configure_logger(
     for handler in root_logger.handlers[:]:  
         root_logger.removeHandler(handler)
 
+    # Ensure the log directory exists once for all file handlers
+    if log_file and any(h in _FILE_HANDLERS for h in handlers):
+        os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+
     # Add requested handlers
+    handler_args = {
+        "log_file": log_file,
+        "max_bytes": max_bytes,
+        "backup_count": backup_count,
+        "buffer_capacity": buffer_capacity,
+        "bytes_mode": bytes_mode,
+        "flush_interval": flush_interval,
+        "rotation_strategy": rotation_strategy,
+        "binary": format == LogFormat.MSGPACK
+    }
+    # Formatters keep no per-handler state, so one instance serves every handler
+    formatter = get_formatter(format)
+    console_formatter = formatter if console_format == format else get_formatter(console_format)
+    created_handlers = []
     for handler_type in handlers:
-        handler_args = {
-            "log_file": log_file,
-            "max_bytes": max_bytes,
-            "backup_count": backup_count
-        }
-
         # Determine which file handler to use if file logging is enabled
-        if handler_type in (LogHandler.FILE, LogHandler.ROTATING_FILE, LogHandler.TIMED_ROTATING_FILE):
+        if handler_type in _FILE_HANDLERS:
             if not log_file:
                 continue  # Skip file handlers if no log file specified
 
@@ -336,7 +1329,26 @@ def configure_logger(
         # Create and add the handler
         handler = create_handler(handler_type, **handler_args)
         if handler:
-            configure_handler(handler, format, level)
+            if handler_type in _FILE_HANDLERS:
+                configure_handler(handler, format, level, formatter)
+            else:
+                configure_handler(handler, console_format, level, console_formatter)
+            created_handlers.append(handler)
+
+    if async_logging and created_handlers:
+        # Callers only enqueue; the listener thread runs the real handlers
+        log_queue = queue.Queue(queue_size) if queue_size > 0 else queue.SimpleQueue()
+        if thread_batching:
+            listener = _BatchQueueListener(log_queue, *created_handlers, respect_handler_level=True)
+            root_logger.addHandler(ThreadLocalBatchHandler(log_queue, overflow_policy=overflow_policy))
+        else:
+            listener = _QueueListener(log_queue, *created_handlers, respect_handler_level=True)
+            root_logger.addHandler(DeferredQueueHandler(log_queue, overflow_policy))
+        listener.core_id = listener_core_id
+        listener.start()
+        _GLOBAL_CONFIG["_listener"] = listener
+    else:
+        for handler in created_handlers:
             root_logger.addHandler(handler)
 
     # Configure specific module levels if provided
@@ -345,12 +1357,8 @@ def configure_logger(
             module_logger = logging.getLogger(module_name)
             module_logger.setLevel(module_level.value)
 
-    # Prevent propagation of logs below the configured level to the console
-    # This ensures that debug logs don't appear in the console when not wanted
-    logging.getLogger().handlers[0].setLevel(level.value if handlers else logging.WARNING)
 
-
-def get_logger(name: str) -> logging.Logger:
+def get_logger(name: str) -> WipekitLogger:
     """Get a logger instance for the specified module name.
 
     This function returns an existing logger if one exists with the given name,
@@ -363,18 +1371,24 @@ def get_logger(name: str) -> logging.Logger:
         A configured logger instance
     """
     # Check if we've already created this logger
-    if name in _LOGGERS:
-        return _LOGGERS[name]
-
-    # Create new logger
-    logger = logging.getLogger(name)
-
-    # Apply module-specific level if configured
-    if _GLOBAL_CONFIG and "module_levels" in _GLOBAL_CONFIG:
-        module_levels = _GLOBAL_CONFIG["module_levels"]
-        if name in module_levels:
-            logger.setLevel(module_levels[name].value)
-
-    # Store for future retrieval
-    _LOGGERS[name] = logger
-    return logger
+    logger = _LOGGERS.get(name)
+    if logger is not None:
+        return logger
+
+    with _LOGGERS_LOCK:
+        # Another thread may have created it while we waited for the lock
+        logger = _LOGGERS.get(name)
+        if logger is not None:
+            return logger
+
+        # Create new logger
+        logger = WipekitLogger(logging.getLogger(name))
+
+        # Apply module-specific level if configured
+        module_level = _GLOBAL_CONFIG.get("module_levels", {}).get(name)
+        if module_level is not None:
+            logger.setLevel(module_level.value)
+
+        # Store for future retrieval
+        _LOGGERS[name] = logger
+        return logger
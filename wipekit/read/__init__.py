@@ -3,12 +3,13 @@ from .mysql import MySQLManager
 from .oracle import OracleManager
 from .config import PostgreSQLConfig, MySQLConfig, OracleConfig
 from .file_reader import FileManager
+from .rows import Row
 
 __all__ = [
     'PostgreSQLManager', 'PostgreSQLConfig',
     'MySQLManager', 'MySQLConfig',
     'OracleManager', 'OracleConfig',
-    'FileManager'
+    'FileManager', 'Row'
 ]
 
 """
@@ -70,4 +71,15 @@ config = OracleConfig(
 with OracleManager(config) as db:
     # Oracle uses :1, :2, etc. for bind variables
     df = db.execute_query('SELECT * FROM emp WHERE deptno = :1', (10,))
+
+Async (asyncio):
+---------------
+from wipekit.read import PostgreSQLConfig
+from wipekit.read.async_postgresql import AsyncPostgreSQLManager  # needs asyncpg
+
+async with AsyncPostgreSQLManager(config) as db:
+    # asyncpg uses $1, $2, etc. for parameters
+    rows = await db.execute_query('SELECT * FROM your_table WHERE id = $1', (123,))
+
+AsyncOracleManager (wipekit.read.async_oracle) is the asyncio counterpart of OracleManager.
 """
\ No newline at end of file
@@ -0,0 +1,231 @@
+"""
+Async Oracle Database Manager Module
+==================================
+
+This module provides an asyncio counterpart of OracleManager built on python-oracledb's
+async API (thin mode, oracledb 2.0+). Queries from many coroutines share one connection
+pool and overlap their I/O instead of serializing on a synchronous pool.
+
+Features:
+---------
+- Async connection pooling with statement caching
+- Support for multiple output formats (dict, Row tuples, pandas DataFrame, Spark DataFrame)
+- Async context manager interface for safe connection handling
+- Error handling and automatic connection cleanup
+
+Dependencies:
+------------
+- Required: oracledb (2.0+)
+- Optional: pandas (for DataFrame output), pyspark (for Spark output)
+
+Example:
+--------
+from wipekit.read import OracleConfig
+from wipekit.read.async_oracle import AsyncOracleManager
+
+config = OracleConfig(
+    host='localhost',
+    port=1521,
+    service_name='ORCL',
+    user='scott',
+    password='tiger',
+    output_format='pandas'
+)
+
+async with AsyncOracleManager(config) as oracle:
+    df = await oracle.execute_query('SELECT * FROM emp WHERE deptno = :1', (10,))
+"""
+
+from typing import Optional, Dict, Any, List, Union
+from contextlib import asynccontextmanager
+from ..logging import configure_logger, get_logger
+
+# oracledb availability is checked by the synchronous module
+from .oracle import OracleManager, ResultType, _is_select
+import oracledb
+
+from .config import OracleConfig
+from ..exceptions import ConnectionError, ValidationError, ConfigurationError
+
+# Logger configuration
+configure_logger()
+logger = get_logger("wipekit.read.async_oracle")
+
+class AsyncOracleManager:
+    """
+    An asyncio Oracle connection manager with the same configuration and output
+    formats as OracleManager.
+    """
+
+    def __init__(self, config: Union[OracleConfig, Dict[str, Any]]):
+        """
+        Initialize the async Oracle connection manager.
+
+        The pool is created here; connections are opened as they are acquired.
+
+        Args:
+            config: Either an OracleConfig object or a dictionary with configuration values
+
+        Raises:
+            ConfigurationError: If the configuration is invalid
+            ConnectionError: If unable to establish connection pool
+        """
+        try:
+            self.config = (config if isinstance(config, OracleConfig)
+                         else OracleConfig.from_dict(config))
+        except ValueError as e:
+            raise ConfigurationError(f"Invalid configuration: {str(e)}")
+
+        self._pool = None
+        self._initialize_connection_pool()
+
+    # DSN and row conversion are shared with the synchronous manager
+    _create_dsn = OracleManager._create_dsn
+    _format_rows = OracleManager._format_rows
+
+    def _initialize_connection_pool(self) -> None:
+        """
+        Initialize the async Oracle connection pool.
+
+        Raises:
+            ConnectionError: If unable to create the connection pool
+        """
+        try:
+            self._pool = oracledb.create_pool_async(
+                user=self.config.user,
+                password=self.config.password,
+                dsn=self._create_dsn(),
+                min=self.config.min_connections,
+                max=self.config.max_connections,
+                increment=1,
+                stmtcachesize=self.config.stmt_cache_size,
+                ping_interval=self.config.ping_interval,
+                max_lifetime_session=self.config.max_session_lifetime
+            )
+
+            logger.info(f"Successfully initialized connection pool to database: {self.config.service_name}")
+
+        except oracledb.Error as e:
+            raise ConnectionError(f"Failed to initialize connection pool: {str(e)}")
+
+    @asynccontextmanager
+    async def get_connection(self, readonly: bool = False):
+        """
+        Async context manager for database connections.
+
+        Args:
+            readonly: Skip the commit round trip on exit, for blocks that only query
+
+        Yields:
+            oracledb.AsyncConnection: Database connection from the pool
+
+        Raises:
+            ConnectionError: If there is an error with the database connection
+        """
+        conn = None
+        try:
+            conn = await self._pool.acquire()
+            yield conn
+            if not readonly:
+                await conn.commit()
+        except oracledb.Error as e:
+            if conn:
+                await conn.rollback()
+            logger.error(f"Database error: {str(e)}")
+            raise ConnectionError(f"Database operation failed: {str(e)}")
+        finally:
+            if conn:
+                await self._pool.release(conn)
+
+    async def execute_query(self, query: str, params: Optional[Union[tuple, dict]] = None) -> ResultType:
+        """
+        Execute a SQL query and return the results in the specified format.
+
+        Args:
+            query: The SQL query to execute
+            params: Query parameters for parameterized queries
+
+        Raises:
+            ConnectionError: If there is a database connection error
+            DataFormatError: If there is an error converting the result format
+        """
+        async with self.get_connection(readonly=_is_select(query)) as conn:
+            cursor = conn.cursor()
+            try:
+                await cursor.execute(query, params or ())
+
+                if not cursor.description:  # No data returned
+                    return []
+
+                columns = [col[0] for col in cursor.description]
+                rows = await cursor.fetchall()
+            except oracledb.Error as e:
+                raise ConnectionError(f"Query execution failed: {str(e)}")
+            finally:
+                cursor.close()
+        return self._format_rows(columns, rows)
+
+    async def execute_batch(
+        self,
+        query: str,
+        params: List[Union[tuple, dict]],
+        batch_errors: bool = False
+    ) -> Optional[List[tuple]]:
+        """
+        Execute a batch of parameterized queries.
+
+        Parameter sets are bound as arrays of config.batch_size rows, one round trip per
+        array; all arrays are committed together.
+
+        Args:
+            query: The SQL query template to execute
+            params: List of parameter sets to use with the query
+            batch_errors: Collect per-row errors instead of aborting the batch
+
+        Returns:
+            With batch_errors, a list of (row_offset, message) tuples for the rows that
+            failed, offsets counted from the start of params; otherwise None
+
+        Raises:
+            ConnectionError: If there is a database connection error
+            ValidationError: If the parameters are invalid
+        """
+        if not params:
+            raise ValidationError("params must not be empty for batch execution")
+
+        batch_size = self.config.batch_size
+        errors = [] if batch_errors else None
+        async with self.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                for start in range(0, len(params), batch_size):
+                    await cursor.executemany(query, params[start:start + batch_size],
+                                             batcherrors=batch_errors)
+                    if batch_errors:
+                        errors.extend((start + error.offset, error.message)
+                                      for error in cursor.getbatcherrors())
+            except oracledb.Error as e:
+                raise ConnectionError(f"Batch execution failed: {str(e)}")
+            finally:
+                cursor.close()
+        return errors
+
+    async def close(self) -> None:
+        """
+        Close the connection pool.
+
+        This method should be awaited when the manager is no longer needed to
+        properly clean up resources.
+        """
+        try:
+            if self._pool:
+                await self._pool.close()
+                logger.info("Connection pool closed successfully")
+        except oracledb.Error as e:
+            logger.error(f"Error closing connection pool: {str(e)}")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
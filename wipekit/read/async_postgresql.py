@@ -0,0 +1,242 @@
+"""
+Async PostgreSQL Database Manager Module
+======================================
+
+This module provides an asyncio counterpart of PostgreSQLManager built on asyncpg.
+Queries from many coroutines share one connection pool and overlap their I/O instead
+of serializing on a synchronous pool, and asyncpg's binary protocol decodes rows
+faster than psycopg2.
+
+Features:
+---------
+- Async connection pooling
+- Support for multiple output formats (dict, Row tuples, pandas DataFrame, Spark DataFrame)
+- Async context manager interface for safe connection handling
+- Error handling and automatic connection cleanup
+
+Dependencies:
+------------
+- Required: asyncpg
+- Optional: pandas (for DataFrame output), pyspark (for Spark output)
+
+Note that asyncpg uses numbered placeholders ($1, $2, ...) instead of %s.
+
+Example:
+--------
+from wipekit.read import PostgreSQLConfig
+from wipekit.read.async_postgresql import AsyncPostgreSQLManager
+
+config = PostgreSQLConfig(
+    host='localhost',
+    port=5432,
+    database='mydb',
+    user='user',
+    password='pass',
+    output_format='pandas'
+)
+async with AsyncPostgreSQLManager(config) as pg:
+    df = await pg.execute_query('SELECT * FROM mytable WHERE id = $1', (42,))
+"""
+
+from typing import Optional, Dict, Any, List, Union
+from contextlib import asynccontextmanager
+from ..logging import configure_logger, get_logger
+
+try:
+    import asyncpg
+except ImportError:
+    raise ImportError(
+        "asyncpg is required for async PostgreSQL database connectivity. "
+        "Install it with: pip install asyncpg"
+    )
+
+from .config import PostgreSQLConfig
+from .postgresql import PostgreSQLManager, ResultType
+from ..exceptions import ConnectionError, ValidationError
+
+# Logger configuration
+configure_logger()
+logger = get_logger("wipekit.read.async_postgresql")
+
+class AsyncPostgreSQLManager:
+    """
+    An asyncio PostgreSQL connection manager with the same configuration and output
+    formats as PostgreSQLManager.
+
+    The pool is created by ``await initialize_pool()`` or on entering ``async with``.
+    """
+
+    def __init__(self, config: Union[PostgreSQLConfig, Dict[str, Any]]):
+        """Initialize the async PostgreSQL connection manager."""
+        try:
+            self.config = (config if isinstance(config, PostgreSQLConfig)
+                        else PostgreSQLConfig.from_dict(config))
+        except ValueError as e:
+            raise ValidationError(f"Invalid configuration: {str(e)}")
+
+        self._pool: Optional[asyncpg.Pool] = None
+
+    # Rows are converted exactly as in the synchronous manager
+    _format_rows = PostgreSQLManager._format_rows
+
+    async def initialize_pool(self) -> None:
+        """Create the connection pool with the configured parameters."""
+        try:
+            self._pool = await asyncpg.create_pool(
+                min_size=self.config.min_connections,
+                max_size=self.config.max_connections,
+                host=self.config.host,
+                port=self.config.port,
+                database=self.config.database,
+                user=self.config.user,
+                password=self.config.password
+            )
+            logger.info(f"Successfully initialized connection pool to database: {self.config.database}")
+        except (asyncpg.PostgresError, OSError) as e:
+            raise ConnectionError(f"Failed to initialize connection pool: {str(e)}")
+
+    @asynccontextmanager
+    async def get_connection(self):
+        """
+        Async context manager for database connections.
+
+        Statements run in autocommit mode; use ``conn.transaction()`` to group them.
+
+        Yields:
+            asyncpg.Connection: Database connection from the pool
+
+        Raises:
+            ConnectionError: If there is an error with the database connection
+        """
+        if self._pool is None:
+            raise ConnectionError("Connection pool is not initialized; call initialize_pool() first")
+        try:
+            async with self._pool.acquire() as conn:
+                yield conn
+        except (asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+            logger.error(f"Database error: {str(e)}")
+            raise ConnectionError(f"Database operation failed: {str(e)}")
+
+    async def execute_query(self, query: str, params: Optional[tuple] = None) -> ResultType:
+        """
+        Execute a SQL query and return the results in the specified format.
+
+        Args:
+            query: The SQL query to execute, with $1, $2, ... placeholders
+            params: Query parameters for parameterized queries
+
+        Raises:
+            ConnectionError: If there is a database connection error
+            DataFormatError: If there is an error converting the result format
+        """
+        async with self.get_connection() as conn:
+            try:
+                stmt = await conn.prepare(query)
+                rows = await stmt.fetch(*(params or ()))
+            except asyncpg.PostgresError as e:
+                raise ConnectionError(f"Query execution failed: {str(e)}")
+            columns = [attribute.name for attribute in stmt.get_attributes()]
+        if not columns:  # No data returned
+            return []
+        if self.config.output_format in ("pandas", "spark"):
+            # pandas and Spark expect tuples; Records only iterate like them
+            rows = [tuple(row) for row in rows]
+        return self._format_rows(columns, rows)
+
+    async def execute_batch(self, query: str, params: List[tuple]) -> None:
+        """
+        Execute a parameterized query for each parameter set, in one transaction.
+
+        Args:
+            query: The SQL query template to execute, with $1, $2, ... placeholders
+            params: List of parameter sets to use with the query
+
+        Raises:
+            ConnectionError: If there is a database connection error
+            ValidationError: If the parameters are invalid
+        """
+        if not params:
+            raise ValidationError("params must not be empty for batch execution")
+
+        async with self.get_connection() as conn:
+            try:
+                async with conn.transaction():
+                    await conn.executemany(query, params)
+            except asyncpg.PostgresError as e:
+                raise ConnectionError(f"Batch execution failed: {str(e)}")
+
+    async def table_exists(self, table_name: str) -> bool:
+        """
+        Check if a table exists in the database.
+
+        Args:
+            table_name (str): Name of the table to check
+
+        Returns:
+            bool: True if table exists, False otherwise
+
+        Raises:
+            ConnectionError: If there is a database connection error
+        """
+        if not isinstance(table_name, str):
+            raise ValidationError("Table name must be a string")
+
+        query = """
+            SELECT EXISTS (
+                SELECT FROM information_schema.tables
+                WHERE table_name = $1
+            );
+        """
+        async with self.get_connection() as conn:
+            try:
+                return await conn.fetchval(query, table_name)
+            except asyncpg.PostgresError as e:
+                raise ConnectionError(f"Query execution failed: {str(e)}")
+
+    async def get_table_schema(self, table_name: str) -> ResultType:
+        """
+        Get the schema information for a table.
+
+        Args:
+            table_name (str): Name of the table
+
+        Returns:
+            Column information for the table, in the configured output format
+
+        Raises:
+            ConnectionError: If there is a database connection error
+            ValidationError: If the table name is invalid
+        """
+        if not isinstance(table_name, str):
+            raise ValidationError("Table name must be a string")
+
+        query = """
+            SELECT column_name, data_type, character_maximum_length,
+                   is_nullable, column_default
+            FROM information_schema.columns
+            WHERE table_name = $1
+            ORDER BY ordinal_position;
+        """
+        return await self.execute_query(query, (table_name,))
+
+    async def close(self) -> None:
+        """
+        Close all database connections in the pool.
+
+        Raises:
+            ConnectionError: If there is an error closing the connections
+        """
+        try:
+            if self._pool:
+                await self._pool.close()
+                logger.info("Closed all database connections")
+        except Exception as e:
+            raise ConnectionError(f"Failed to close connections: {str(e)}")
+
+    async def __aenter__(self):
+        if self._pool is None:
+            await self.initialize_pool()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
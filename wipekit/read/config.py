@@ -13,7 +13,7 @@ Configuration Classes:
 
 Common Features:
     - Connection pool management (min/max connections)
-    - Multiple output formats (dict, pandas, spark)
+    - Multiple output formats (dict, rows, pandas, spark)
     - Comprehensive parameter validation
     - Dictionary-based instantiation
     - Default values for common parameters
@@ -36,10 +36,52 @@ Example:
     >>> config = PostgreSQLConfig.from_dict(config_dict)
 """
 
+import sys
 from dataclasses import dataclass
+from typing import Optional
 from ..exceptions import ConfigurationError
 
-@dataclass
+# Supported values for the output_format option, checked by every validate()
+_VALID_OUTPUT_FORMATS = frozenset(("dict", "rows", "pandas", "spark"))
+_OUTPUT_FORMAT_ERROR = "output_format must be one of: " + ", ".join(sorted(_VALID_OUTPUT_FORMATS))
+
+# Config instances are immutable once validated; __slots__ are generated where
+# supported (Python 3.10+)
+_DATACLASS_OPTIONS = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS["slots"] = True
+
+
+def _as_int(value, default: int) -> int:
+    """Return value as an int, skipping the conversion when it already is one."""
+    if type(value) is int:
+        return value
+    if type(value) is bool:
+        # int(True) would silently turn a flag into port/pool size 1
+        raise ValueError(f"expected an integer, got {value!r}")
+    return int(value if value is not None else default)
+
+def _as_optional_int(value) -> Optional[int]:
+    """Return value as an int like _as_int, keeping None (option not set) as None."""
+    return None if value is None else _as_int(value, 0)
+
+# String spellings accepted for boolean options (e.g. from environment variables or YAML)
+_BOOL_STRINGS = {"true": True, "1": True, "yes": True, "false": False, "0": False, "no": False}
+
+def _as_bool(value, default: bool) -> bool:
+    """Return value as a bool, accepting bools and the strings true/false, 1/0 and yes/no."""
+    if value is None:
+        return default
+    if type(value) is bool:
+        return value
+    if isinstance(value, str):
+        try:
+            return _BOOL_STRINGS[value.strip().lower()]
+        except KeyError:
+            pass
+    raise ValueError(f"expected a boolean, got {value!r}")
+
+@dataclass(**_DATACLASS_OPTIONS)
 class PostgreSQLConfig:
     """Configuration class for PostgreSQL database connections."""
     
@@ -50,10 +92,21 @@ class PostgreSQLConfig:
     password: str
     min_connections: int = 1
     max_connections: int = 10
-    output_format: str = "dict"  # Options: "dict", "pandas", "spark"
+    output_format: str = "dict"  # Options: "dict", "rows", "pandas", "spark"
+    # When set, pandas queries return an iterator of DataFrames of this many rows
+    stream_chunksize: Optional[int] = None
+    # Run parameterized queries as server-side prepared statements, prepared once per
+    # connection and query text
+    enable_prepared: bool = False
+    # Reuse one cursor per pooled connection in execute_query instead of opening one per
+    # call; the cursor keeps the last result buffered until the next query
+    reuse_cursors: bool = False
+    # Rows per INSERT statement in execute_batch_insert
+    batch_size: int = 1000
     
     def __post_init__(self):
         self.validate()
+        object.__setattr__(self, "output_format", sys.intern(self.output_format))
     
     def validate(self) -> None:
         """
@@ -62,14 +115,21 @@ class PostgreSQLConfig:
         Raises:
             ConfigurationError: If any configuration parameter is invalid
         """
-        if not isinstance(self.port, int):
+        if type(self.port) is not int:
             raise ConfigurationError("Port must be an integer")
         
         if self.min_connections > self.max_connections:
             raise ConfigurationError("min_connections cannot be greater than max_connections")
             
-        if self.output_format not in ["dict", "pandas", "spark"]:
-            raise ConfigurationError("output_format must be one of: dict, pandas, spark")
+        if self.output_format not in _VALID_OUTPUT_FORMATS:
+            raise ConfigurationError(_OUTPUT_FORMAT_ERROR)
+
+        if self.stream_chunksize is not None and (
+                type(self.stream_chunksize) is not int or self.stream_chunksize <= 0):
+            raise ConfigurationError("stream_chunksize must be a positive integer")
+            
+        if type(self.batch_size) is not int or self.batch_size <= 0:
+            raise ConfigurationError("batch_size must be a positive integer")
 
     @classmethod
     def from_dict(cls, config: dict) -> 'PostgreSQLConfig':
@@ -88,20 +148,24 @@ class PostgreSQLConfig:
         try:
             return cls(
                 host=config.get('host', 'localhost'),
-                port=int(config.get('port', 5432)),
+                port=_as_int(config.get('port'), 5432),
                 database=config['database'],
                 user=config['user'],
                 password=config['password'],
-                min_connections=int(config.get('min_connections', 1)),
-                max_connections=int(config.get('max_connections', 10)),
-                output_format=config.get('output_format', 'dict')
+                min_connections=_as_int(config.get('min_connections'), 1),
+                max_connections=_as_int(config.get('max_connections'), 10),
+                output_format=config.get('output_format', 'dict'),
+                stream_chunksize=_as_optional_int(config.get('stream_chunksize')),
+                enable_prepared=_as_bool(config.get('enable_prepared'), False),
+                reuse_cursors=_as_bool(config.get('reuse_cursors'), False),
+                batch_size=_as_int(config.get('batch_size'), 1000)
             )
         except KeyError as e:
             raise ConfigurationError(f"Missing required configuration value: {str(e)}")
         except ValueError as e:
             raise ConfigurationError(f"Invalid configuration value: {str(e)}")
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MySQLConfig:
     """Configuration class for MySQL database connections."""
     
@@ -112,10 +176,14 @@ class MySQLConfig:
     password: str = None
     min_connections: int = 1
     max_connections: int = 10
-    output_format: str = "dict"  # Options: "dict", "pandas", "spark"
+    output_format: str = "dict"  # Options: "dict", "rows", "pandas", "spark"
+    # Use the pure-Python protocol instead of the C extension (used only when available);
+    # the C extension mainly speeds up reading large results
+    use_pure: bool = False
     
     def __post_init__(self):
         self.validate()
+        object.__setattr__(self, "output_format", sys.intern(self.output_format))
     
     def validate(self) -> None:
         """
@@ -135,14 +203,14 @@ class MySQLConfig:
         Raises:
             ConfigurationError: If any configuration parameter is invalid or missing
         """
-        if not isinstance(self.port, int):
+        if type(self.port) is not int:
             raise ConfigurationError("Port must be an integer")
         
         if self.min_connections > self.max_connections:
             raise ConfigurationError("min_connections cannot be greater than max_connections")
             
-        if self.output_format not in ["dict", "pandas", "spark"]:
-            raise ConfigurationError("output_format must be one of: dict, pandas, spark")
+        if self.output_format not in _VALID_OUTPUT_FORMATS:
+            raise ConfigurationError(_OUTPUT_FORMAT_ERROR)
             
         if not self.database:
             raise ConfigurationError("database name is required")
@@ -170,20 +238,21 @@ class MySQLConfig:
         try:
             return cls(
                 host=config.get('host', 'localhost'),
-                port=int(config.get('port', 3306)),
+                port=_as_int(config.get('port'), 3306),
                 database=config['database'],
                 user=config['user'],
                 password=config['password'],
-                min_connections=int(config.get('min_connections', 1)),
-                max_connections=int(config.get('max_connections', 10)),
-                output_format=config.get('output_format', 'dict')
+                min_connections=_as_int(config.get('min_connections'), 1),
+                max_connections=_as_int(config.get('max_connections'), 10),
+                output_format=config.get('output_format', 'dict'),
+                use_pure=_as_bool(config.get('use_pure'), False)
             )
         except KeyError as e:
             raise ConfigurationError(f"Missing required configuration value: {str(e)}")
         except ValueError as e:
             raise ConfigurationError(f"Invalid configuration value: {str(e)}")
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class OracleConfig:
     """Configuration class for Oracle database connections."""
     
@@ -194,10 +263,29 @@ class OracleConfig:
     password: str = None
     min_connections: int = 1
     max_connections: int = 10
-    output_format: str = "dict"  # Options: "dict", "pandas", "spark"
+    output_format: str = "dict"  # Options: "dict", "rows", "pandas", "spark"
+    # When set, pandas queries return an iterator of DataFrames of this many rows
+    stream_chunksize: Optional[int] = None
+    # Rows bound per executemany() round trip in execute_batch
+    batch_size: int = 10_000
+    # Statements cached per connection by the driver, keyed by SQL text (0 disables)
+    stmt_cache_size: int = 50
+    # Upper bound, in characters, for VARCHAR2 fetch buffers. Columns declared wider
+    # (e.g. VARCHAR2(4000) holding short strings) otherwise get buffers of their full
+    # declared size for every row of a fetch array. Values longer than this fail to fetch.
+    max_string_size: Optional[int] = None
+    # Fetch pandas results as Arrow data (oracledb 3.0+ with pyarrow) instead of row
+    # tuples; column dtypes follow the Arrow types
+    arrow_fetch: bool = False
+    # Seconds a pooled connection may sit idle before acquire() pings it first; a
+    # negative value never pings (saves the round trip on trusted networks)
+    ping_interval: int = 60
+    # Seconds after which pooled sessions are closed and replaced (0 keeps them)
+    max_session_lifetime: int = 0
     
     def __post_init__(self):
         self.validate()
+        object.__setattr__(self, "output_format", sys.intern(self.output_format))
     
     def validate(self) -> None:
         """
@@ -206,14 +294,34 @@ class OracleConfig:
         Raises:
             ConfigurationError: If any configuration parameter is invalid
         """
-        if not isinstance(self.port, int):
+        if type(self.port) is not int:
             raise ConfigurationError("Port must be an integer")
         
         if self.min_connections > self.max_connections:
             raise ConfigurationError("min_connections cannot be greater than max_connections")
             
-        if self.output_format not in ["dict", "pandas", "spark"]:
-            raise ConfigurationError("output_format must be one of: dict, pandas, spark")
+        if self.output_format not in _VALID_OUTPUT_FORMATS:
+            raise ConfigurationError(_OUTPUT_FORMAT_ERROR)
+
+        if self.stream_chunksize is not None and (
+                type(self.stream_chunksize) is not int or self.stream_chunksize <= 0):
+            raise ConfigurationError("stream_chunksize must be a positive integer")
+            
+        if type(self.batch_size) is not int or self.batch_size <= 0:
+            raise ConfigurationError("batch_size must be a positive integer")
+            
+        if type(self.stmt_cache_size) is not int or self.stmt_cache_size < 0:
+            raise ConfigurationError("stmt_cache_size must be a non-negative integer")
+            
+        if self.max_string_size is not None and (
+                type(self.max_string_size) is not int or self.max_string_size <= 0):
+            raise ConfigurationError("max_string_size must be a positive integer")
+            
+        if type(self.ping_interval) is not int:
+            raise ConfigurationError("ping_interval must be an integer")
+            
+        if type(self.max_session_lifetime) is not int or self.max_session_lifetime < 0:
+            raise ConfigurationError("max_session_lifetime must be a non-negative integer")
             
         if not self.service_name:
             raise ConfigurationError("service_name is required")
@@ -241,13 +349,20 @@ class OracleConfig:
         try:
             return cls(
                 host=config.get('host', 'localhost'),
-                port=int(config.get('port', 1521)),
+                port=_as_int(config.get('port'), 1521),
                 service_name=config['service_name'],
                 user=config['user'],
                 password=config['password'],
-                min_connections=int(config.get('min_connections', 1)),
-                max_connections=int(config.get('max_connections', 10)),
-                output_format=config.get('output_format', 'dict')
+                min_connections=_as_int(config.get('min_connections'), 1),
+                max_connections=_as_int(config.get('max_connections'), 10),
+                output_format=config.get('output_format', 'dict'),
+                stream_chunksize=_as_optional_int(config.get('stream_chunksize')),
+                batch_size=_as_int(config.get('batch_size'), 10_000),
+                stmt_cache_size=_as_int(config.get('stmt_cache_size'), 50),
+                max_string_size=_as_optional_int(config.get('max_string_size')),
+                arrow_fetch=_as_bool(config.get('arrow_fetch'), False),
+                ping_interval=_as_int(config.get('ping_interval'), 60),
+                max_session_lifetime=_as_int(config.get('max_session_lifetime'), 0)
             )
         except KeyError as e:
             raise ConfigurationError(f"Missing required configuration value: {str(e)}")
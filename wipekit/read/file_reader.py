@@ -18,83 +18,479 @@ reader = UniversalDataReader()
 df = reader.read('data.parquet')
 """
 
+from __future__ import annotations
+
 import os
-from typing import Optional
+import glob
+import logging
+from stat import S_ISDIR, S_ISREG
+from functools import lru_cache
+from typing import Iterator, List, Optional, Union, TYPE_CHECKING
 from ..exceptions import ValidationError
-from ..logging import getLogger, configure_logger
+from ..logging import get_logger, configure_logger
+
+# pandas is imported on first read (see FileManager._pandas)
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Logger configuration
 configure_logger()
-logger = getLogger("wipekit.read.file_reader")
+logger = get_logger("wipekit.read.file_reader")
 
-try:
-    import pandas as pd
-except ImportError:
-    raise ImportError(
-        "pandas is required for reading data files. "
-        "Install it with: pip install pandas"
-    )
+# Supported read backends
+_BACKENDS = ('pandas', 'pyarrow')
+
+# Default read buffer for Parquet column chunks; consecutive chunks are coalesced into one read
+_PARQUET_BUFFER_SIZE = 8 << 20
+
+
+def _read_csv_pyarrow(source, columns=None, delimiter: str = ',', **kwargs):
+    """Read a delimited text file into a pyarrow Table."""
+    import pyarrow.csv as pacsv
+    kwargs.setdefault('parse_options', pacsv.ParseOptions(delimiter=delimiter))
+    if columns is not None:
+        kwargs.setdefault('convert_options', pacsv.ConvertOptions(include_columns=columns))
+    return pacsv.read_csv(source, **kwargs)
+
+
+def _read_tsv_pyarrow(source, columns=None, **kwargs):
+    """Read a tab-separated file into a pyarrow Table."""
+    return _read_csv_pyarrow(source, columns=columns, delimiter='\t', **kwargs)
+
+
+def _read_json_pyarrow(source, columns=None, **kwargs):
+    """Read a newline-delimited JSON file into a pyarrow Table.
+
+    pyarrow.json only reads newline-delimited JSON, so lines=True (the pandas option)
+    is accepted and ignored, and lines=False is rejected.
+    """
+    if not kwargs.pop('lines', True):
+        raise ValueError("The pyarrow backend only reads newline-delimited JSON (lines=True)")
+    import pyarrow.json as paj
+    table = paj.read_json(source, **kwargs)
+    return table.select(columns) if columns is not None else table
+
+
+def _read_parquet_pyarrow(source, columns=None, **kwargs):
+    """Read a Parquet file into a pyarrow Table."""
+    import pyarrow.parquet as pq
+    return pq.read_table(source, columns=columns, **kwargs)
+
+
+def _read_orc_pyarrow(source, columns=None, **kwargs):
+    """Read an ORC file into a pyarrow Table."""
+    import pyarrow.orc as porc
+    return porc.read_table(source, columns=columns, **kwargs)
+
+
+# Extension -> pyarrow reader used by the 'pyarrow' backend
+_PYARROW_READERS = {
+    '.csv': _read_csv_pyarrow,
+    '.tsv': _read_tsv_pyarrow,
+    '.json': _read_json_pyarrow,
+    '.parquet': _read_parquet_pyarrow,
+    '.orc': _read_orc_pyarrow,
+}
+
+@lru_cache(maxsize=32)
+def _get_parquet_file(file_path: str, mtime_ns: int, size: int, pre_buffer: bool, buffer_size: int):
+    """
+    Open a pyarrow ParquetFile, caching it so the footer metadata is parsed once per file version.
+    mtime_ns and size are only part of the cache key, so a rewritten file is re-opened.
+    """
+    import pyarrow.parquet as pq
+    return pq.ParquetFile(file_path, memory_map=True, pre_buffer=pre_buffer, buffer_size=buffer_size)
+
+
+# Extension -> pyarrow.dataset format for directory and glob reads
+_DATASET_FORMATS = {
+    '.csv': 'csv',
+    '.tsv': 'tsv',
+    '.json': 'json',
+    '.parquet': 'parquet',
+    '.orc': 'orc',
+}
+
+# Target input bytes per chunk when streaming CSV/TSV with stream=True
+_CSV_STREAM_CHUNK_BYTES = 256 << 20
+
+# Bytes sampled from the head of a CSV/TSV file to estimate the average row size
+_CSV_SAMPLE_BYTES = 1 << 16
+
+# Block size used by pyarrow when parsing newline-delimited JSON
+_JSON_BLOCK_SIZE = 1 << 24
+
+# Characters that mark a path as a glob pattern
+_GLOB_CHARS = ('*', '?', '[')
 
 class FileManager(object):
     """
     Enterprise-level universal data reader for multiple file formats.
     """
+    # pandas module, imported on first use so importing wipekit.read does not load it
+    _pd = None
+
     def __init__(self):        
         pass
 
-    def read(self, file_path: str, **kwargs) -> Optional[pd.DataFrame]:
+    @classmethod
+    def _pandas(cls):
         """
-        Read a file into a pandas DataFrame based on its extension.
+        Import pandas on first use and cache it on the class.
+        Returns:
+            module: pandas
+        Raises:
+            ImportError: If pandas is not installed
+        """
+        if cls._pd is None:
+            try:
+                import pandas
+            except ImportError:
+                raise ImportError(
+                    "pandas is required for reading data files. "
+                    "Install it with: pip install pandas"
+                )
+            cls._pd = pandas
+        return cls._pd
+
+    @staticmethod
+    def _memory_map(file_path: str):
+        """
+        Open a file as a pyarrow memory map so readers decode straight from the page cache.
         Args:
             file_path (str): Path to the data file
+        Returns:
+            pyarrow.MemoryMappedFile
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            logger.error("pyarrow is required for memory-mapped reads. Install with: pip install pyarrow")
+            raise
+        return pa.memory_map(file_path, 'r')
+
+    @staticmethod
+    def _parquet_io_options(kwargs: dict) -> dict:
+        """
+        Pop the Parquet I/O options from kwargs, filling in defaults.
+        Args:
+            kwargs (dict): Keyword arguments passed to read()
+        Returns:
+            dict: pre_buffer and buffer_size for the pyarrow Parquet reader
+        """
+        return {
+            'pre_buffer': kwargs.pop('pre_buffer', True),
+            'buffer_size': kwargs.pop('buffer_size', _PARQUET_BUFFER_SIZE),
+        }
+
+    @staticmethod
+    def _iter_parquet(file_path: str, chunk_rows: int, columns=None,
+                      types_mapper=None, **io_options) -> Iterator[pd.DataFrame]:
+        """
+        Yield a Parquet file as DataFrames of at most chunk_rows rows.
+        Args:
+            file_path (str): Path to the Parquet file
+            chunk_rows (int): Maximum number of rows per yielded DataFrame
+            columns (list, optional): Columns to read
+            types_mapper (callable, optional): Passed to pyarrow's to_pandas
+            **io_options: pre_buffer / buffer_size for pyarrow.parquet.ParquetFile
+        Yields:
+            pd.DataFrame
+        """
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            logger.error("pyarrow is required for chunked Parquet reads. Install with: pip install pyarrow")
+            raise
+        stat = os.stat(file_path)
+        parquet_file = _get_parquet_file(file_path, stat.st_mtime_ns, stat.st_size,
+                                         io_options['pre_buffer'], io_options['buffer_size'])
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas(types_mapper=types_mapper)
+
+    @staticmethod
+    def _estimate_csv_chunksize(file_path: str) -> int:
+        """
+        Estimate how many rows of a delimited file fit in _CSV_STREAM_CHUNK_BYTES.
+        Args:
+            file_path (str): Path to the CSV/TSV file
+        Returns:
+            int: Number of rows per chunk
+        """
+        with open(file_path, 'rb') as f:
+            sample = f.read(_CSV_SAMPLE_BYTES)
+        bytes_per_row = len(sample) / max(sample.count(b'\n'), 1)
+        return max(int(_CSV_STREAM_CHUNK_BYTES / max(bytes_per_row, 1)), 1)
+
+    def _read_csv(self, file_path: str, columns=None, **kwargs):
+        """
+        Read a CSV/TSV file with pandas, memory-mapped by default.
+        With chunksize, or stream=True to pick a chunksize of roughly 256 MB of input,
+        an iterator of DataFrames is returned instead.
+        Args:
+            file_path (str): Path to the CSV/TSV file
+            columns (list, optional): Columns to read
+            **kwargs: Additional arguments for pd.read_csv
+        Returns:
+            pd.DataFrame or pandas TextFileReader
+        """
+        if kwargs.get('engine') != 'pyarrow':
+            # pandas rejects memory_map with its pyarrow engine
+            kwargs.setdefault('memory_map', True)
+        if columns is not None:
+            kwargs.setdefault('usecols', columns)
+        if kwargs.pop('stream', False) and not kwargs.get('chunksize'):
+            kwargs['chunksize'] = self._estimate_csv_chunksize(file_path)
+            logger.info("Streaming %s in chunks of %d rows", file_path, kwargs['chunksize'])
+        return self._pandas().read_csv(file_path, **kwargs)
+
+    def _read_tsv(self, file_path: str, columns=None, **kwargs):
+        """
+        Read a tab-separated file with pandas; see _read_csv.
+        """
+        return self._read_csv(file_path, columns, sep='\t', **kwargs)
+
+    def _read_json(self, file_path: str, columns=None, **kwargs):
+        """
+        Read a JSON file with pandas. Newline-delimited JSON (lines=True) with no other
+        pandas options is parsed by pyarrow.json straight into columnar buffers when pyarrow
+        is installed, falling back to pd.read_json if pyarrow cannot infer a schema.
+        Nested objects come back as dict values; flatten them with pd.json_normalize if needed.
+        Args:
+            file_path (str): Path to the JSON file
+            columns (list, optional): Columns to keep
+            **kwargs: Additional arguments for pd.read_json
+        Returns:
+            pd.DataFrame or pandas JsonReader
+        """
+        if kwargs.get('lines') and kwargs.keys() <= {'lines'}:
+            try:
+                import pyarrow as pa
+                import pyarrow.json as paj
+            except ImportError:
+                pa = None
+            if pa is not None:
+                try:
+                    with self._memory_map(file_path) as source:
+                        table = paj.read_json(source, read_options=paj.ReadOptions(block_size=_JSON_BLOCK_SIZE))
+                    if columns is not None:
+                        table = table.select(columns)
+                    return table.to_pandas()
+                except pa.ArrowInvalid as e:
+                    logger.warning(f"pyarrow could not parse {file_path}, falling back to pandas: {e}")
+
+        pd = self._pandas()
+        df = pd.read_json(file_path, **kwargs)
+        if columns is not None and isinstance(df, pd.DataFrame):
+            return df[columns]
+        return df
+
+    def _read_parquet(self, file_path: str, columns=None, **kwargs) -> pd.DataFrame:
+        """
+        Read a Parquet file with pandas, from a memory map when pyarrow is the engine.
+        A column projection without other pandas options is read by pyarrow directly and
+        converted with split_blocks and self_destruct, so each Arrow column is released
+        once converted instead of being consolidated into a second copy.
+        Args:
+            file_path (str): Path to the Parquet file
+            columns (list, optional): Columns to read
+            **kwargs: Additional arguments for pd.read_parquet
+        Returns:
+            pd.DataFrame
+        """
+        pq = None
+        if kwargs.get('engine', 'auto') != 'fastparquet':
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                pass
+        io_options = self._parquet_io_options(kwargs)
+        if pq is None:
+            # fastparquet opens the path itself and takes no pyarrow I/O options
+            return self._pandas().read_parquet(file_path, columns=columns, **kwargs)
+        if columns is not None and not kwargs:
+            # use_pandas_metadata also reads the stored index columns, as pd.read_parquet does
+            table = pq.read_table(file_path, columns=columns, memory_map=True,
+                                  use_pandas_metadata=True, **io_options)
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+        kwargs.update(io_options)
+        with self._memory_map(file_path) as source:
+            return self._pandas().read_parquet(source, columns=columns, **kwargs)
+
+    def _read_orc(self, file_path: str, columns=None, **kwargs) -> pd.DataFrame:
+        """
+        Read an ORC file with pandas from a memory map.
+        A column projection without other pandas options is read by pyarrow directly
+        and converted with self_destruct, as for Parquet.
+        Args:
+            file_path (str): Path to the ORC file
+            columns (list, optional): Columns to read
+            **kwargs: Additional arguments for pd.read_orc
+        Returns:
+            pd.DataFrame
+        """
+        with self._memory_map(file_path) as source:
+            if columns is not None and not kwargs:
+                import pyarrow.orc as porc
+                table = porc.ORCFile(source).read(columns=columns)
+                return table.to_pandas(split_blocks=True, self_destruct=True)
+            return self._pandas().read_orc(source, columns=columns, **kwargs)
+
+    def _read_avro(self, file_path: str, columns=None, **kwargs) -> pd.DataFrame:
+        """
+        Read an Avro file through pyarrow.
+        Args:
+            file_path (str): Path to the Avro file
+            columns (list, optional): Columns to keep
+        Returns:
+            pd.DataFrame
+        """
+        try:
+            import pyarrow.avro as pavro
+            with self._memory_map(file_path) as source:
+                table = pavro.read_table(source)
+                if columns is not None:
+                    table = table.select(columns)
+                return table.to_pandas()
+        except ImportError:
+            logger.error("pyarrow is required for Avro support. Install with: pip install pyarrow")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to read Avro file: {e}")
+            raise
+
+    # Extension -> reader used by the 'pandas' backend, resolved once when the class is built
+    _READERS = {
+        '.csv': _read_csv,
+        '.tsv': _read_tsv,
+        '.json': _read_json,
+        '.parquet': _read_parquet,
+        '.orc': _read_orc,
+        '.avro': _read_avro,
+    }
+
+    @staticmethod
+    def _read_dataset(path: str, columns=None, file_format: Optional[str] = None, filter=None,
+                      types_mapper=None) -> pd.DataFrame:
+        """
+        Read a directory or glob of files as one DataFrame using pyarrow.dataset.
+        Files are scanned in parallel and concatenated into a single table.
+        Args:
+            path (str): Directory or glob pattern (e.g. 'data/*.parquet')
+            columns (list, optional): Columns to read
+            file_format (str, optional): One of csv, tsv, json, parquet, orc. Defaults to the
+                pattern's extension, or parquet for directories.
+            filter (pyarrow.compute.Expression, optional): Row filter pushed down into the scan
+            types_mapper (callable, optional): Passed to pyarrow's to_pandas
+        Returns:
+            pd.DataFrame
+        """
+        try:
+            import pyarrow.dataset as ds
+        except ImportError:
+            logger.error("pyarrow is required for multi-file reads. Install with: pip install pyarrow")
+            raise
+
+        if os.path.isdir(path):
+            source = path
+            file_format = file_format or 'parquet'
+        else:
+            source = sorted(glob.glob(path))
+            if not source:
+                raise FileNotFoundError(f"No files match: {path}")
+            file_format = file_format or _DATASET_FORMATS.get(os.path.splitext(path)[1].lower())
+
+        if file_format not in _DATASET_FORMATS.values():
+            raise ValueError(f"Unsupported dataset format: {file_format}")
+        if file_format == 'tsv':
+            import pyarrow.csv as pacsv
+            file_format = ds.CsvFileFormat(parse_options=pacsv.ParseOptions(delimiter='\t'))
+
+        dataset = ds.dataset(source, format=file_format)
+        table = dataset.to_table(columns=columns, filter=filter, use_threads=True)
+        return table.to_pandas(types_mapper=types_mapper)
+
+    def read(self, file_path: Union[str, os.PathLike], columns: Optional[List[str]] = None, backend: str = 'pandas',
+             chunk_rows: Optional[int] = None, **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame], None]:
+        """
+        Read a file into a pandas DataFrame based on its extension.
+        Args:
+            file_path (str or os.PathLike): Path to the data file. A directory or a glob pattern
+                (e.g. 'data/*.parquet') is read as a single dataset via pyarrow.dataset; in that
+                mode the 'format' (csv, tsv, json, parquet, orc) and 'filter'
+                (pyarrow.compute.Expression) kwargs are supported.
+            columns (List[str], optional): Columns to read. Parquet and ORC skip decoding the
+                other columns, CSV/TSV pass them as usecols, JSON and Avro select after reading.
+            backend (str): 'pandas' (default) to parse with pandas' readers, or 'pyarrow' to parse
+                CSV/TSV/JSON/Parquet/ORC with pyarrow directly and return Arrow-backed columns.
+                With 'pyarrow', kwargs are passed to the pyarrow reader (e.g. read_options,
+                parse_options, convert_options for CSV; columns, filters for Parquet).
+                Avro is always read through pyarrow.
+            chunk_rows (int, optional): Parquet only. When set, return an iterator of DataFrames of
+                at most chunk_rows rows instead of loading the whole file. Other kwargs are
+                ignored in this mode, except pre_buffer and buffer_size.
             **kwargs: Additional arguments for pandas read functions
                 Supported kwargs by file type:
                 - CSV/TSV: sep, delimiter, header, names, index_col, usecols, dtype, engine, encoding, nrows, skiprows, na_values, parse_dates, etc.
+                  chunksize returns an iterator of DataFrames; stream=True does the same with a
+                  chunksize picked to cover roughly 256 MB of input per chunk.
                 - JSON: orient, typ, dtype, convert_axes, convert_dates, keep_default_dates, numpy, precise_float, date_unit, encoding, lines, chunksize, compression, etc.
-                - Parquet: engine, columns, use_nullable_dtypes, filesystem, filters, etc.
+                  lines=True on its own is parsed with pyarrow.json when available.
+                - Parquet: engine, use_nullable_dtypes, filesystem, filters, etc.
+                  pre_buffer (default True) and buffer_size (default 8 MB) control how pyarrow
+                  coalesces column chunk reads; they are not passed to the fastparquet engine.
                 - ORC: columns, use_nullable_dtypes, filesystem, etc.
                 - Avro: columns (if supported by backend), use_nullable_dtypes, etc. (requires pyarrow)
         Returns:
-            pd.DataFrame or None
+            pd.DataFrame, an iterator of pd.DataFrame (chunked or streamed reads) or None
         Raises:
             ValueError: If the file format is unsupported or reading fails
         """
-        if not os.path.isfile(file_path):
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unsupported backend: {backend}. Use one of: {', '.join(_BACKENDS)}")
+        pd = self._pandas()
+        # pathlib.Path and other path-like objects are sliced as strings below
+        file_path = os.fspath(file_path)
+        # One stat call tells files, directories and glob patterns apart
+        try:
+            mode = os.stat(file_path).st_mode
+        except OSError:
+            mode = None
+        if (S_ISDIR(mode) if mode is not None
+                else any(c in file_path for c in _GLOB_CHARS)):
+            logger.info("Reading dataset: %s", file_path)
+            types_mapper = pd.ArrowDtype if backend == 'pyarrow' else None
+            return self._read_dataset(file_path, columns, kwargs.get('format'),
+                                      kwargs.get('filter'), types_mapper)
+        if mode is None or not S_ISREG(mode):
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        ext = os.path.splitext(file_path)[1].lower()
+        # Slice the extension off the end instead of splitting the whole path
+        dot = file_path.rfind('.')
+        ext = file_path[dot:].lower() if dot > file_path.rfind(os.sep) else ''
+        if columns is not None:
+            logger.info("Projecting columns: %s", columns)
         try:
-            if ext == '.csv':
-                logger.info(f"Reading CSV file: {file_path}")
-                return pd.read_csv(file_path, **kwargs)
-            elif ext == '.tsv':
-                logger.info(f"Reading TSV file: {file_path}")
-                return pd.read_csv(file_path, sep='\t', **kwargs)
-            elif ext == '.json':
-                logger.info(f"Reading JSON file: {file_path}")
-                return pd.read_json(file_path, **kwargs)
-            elif ext == '.parquet':
-                logger.info(f"Reading Parquet file: {file_path}")
-                return pd.read_parquet(file_path, **kwargs)
-            elif ext == '.orc':
-                logger.info(f"Reading ORC file: {file_path}")
-                return pd.read_orc(file_path, **kwargs)
-            elif ext == '.avro':
-                logger.info(f"Reading Avro file: {file_path}")
-                try:
-                    import pyarrow as pa
-                    import pyarrow.avro as pavro
-                    with pa.memory_map(file_path, 'r') as source:
-                        table = pavro.read_table(source)
-                        return table.to_pandas()
-                except ImportError:
-                    logger.error("pyarrow is required for Avro support. Install with: pip install pyarrow")
-                    raise 
-                except Exception as e:
-                    logger.error(f"Failed to read Avro file: {e}")
-                    raise
-            else:
+            if ext == '.parquet' and chunk_rows:
+                logger.info("Reading Parquet file in chunks of %d rows: %s", chunk_rows, file_path)
+                types_mapper = pd.ArrowDtype if backend == 'pyarrow' else None
+                return self._iter_parquet(file_path, chunk_rows, columns, types_mapper,
+                                          **self._parquet_io_options(kwargs))
+            elif backend == 'pyarrow' and ext in _PYARROW_READERS:
+                if ext == '.parquet':
+                    kwargs.update(self._parquet_io_options(kwargs))
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Reading %s file with pyarrow: %s", ext[1:].upper(), file_path)
+                with self._memory_map(file_path) as source:
+                    table = _PYARROW_READERS[ext](source, columns=columns, **kwargs)
+                return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+            reader = self._READERS.get(ext)
+            if reader is None:
                 raise ValueError(f"Unsupported file extension: {ext}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Reading %s file: %s", ext[1:].upper(), file_path)
+            return reader(self, file_path, columns, **kwargs)
         except ValidationError as e:
             logger.error(f"Failed to read file {file_path}: {e}")
             raise
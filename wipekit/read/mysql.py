@@ -9,7 +9,7 @@ robust error handling, and flexible data format conversions.
 Features:
 ---------
 - Connection pooling for efficient database access
-- Multiple output formats (dict, pandas DataFrame)
+- Multiple output formats (dict, Row tuples, pandas DataFrame)
 - Context manager interface for safe connection handling
 - Comprehensive error handling and connection cleanup
 - Query parameterization for SQL injection prevention
@@ -40,39 +40,78 @@ with MySQLManager(config) as mysql:
     print(f"Found {len(df)} active records")
 """
 
+import itertools
+import threading
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Union, TYPE_CHECKING
 from contextlib import contextmanager
 from ..logging import configure_logger, get_logger
 
-# Third-party imports
-try:
-    import mysql.connector
-    from mysql.connector import pooling
-except ImportError:
-    raise ImportError(
-        "mysql-connector-python is required. "
-        "Install it with: pip install mysql-connector-python"
-    )
+# Third-party imports: mysql-connector-python is imported when the first manager
+# is created (see _import_mysql_connector), not when wipekit.read is imported
+mysql = None
 
 # Local imports
 from .config import MySQLConfig
+from .rows import Row, row_class
 from ..exceptions import (
     ConnectionError, 
     DataFormatError, 
-    ValidationError,
-    ConfigurationError
+    ValidationError
 )
 
 # Type checking imports
 if TYPE_CHECKING:
     import pandas as pd
+    from pyspark.sql import DataFrame as SparkDataFrame
 
 # Configure logging
 configure_logger()
 logger = get_logger("wipekit.read.mysql")
 
+# Connection pools shared by managers with the same connection settings
+_POOL_CACHE: Dict[tuple, Any] = {}
+_POOL_CACHE_LOCK = threading.Lock()
+# Suffixes that keep pool names unique within the process
+_POOL_IDS = itertools.count(1)
+
+# Rows per executemany() call in execute_batch; the driver sends each INSERT chunk as one
+# multi-row statement, and the chunking keeps each statement under max_allowed_packet
+_BATCH_ROWS = 1000
+
 # Type alias for query results
-ResultType = Union[List[Dict[str, Any]], 'pd.DataFrame']
+ResultType = Union[List[Dict[str, Any]], List[Row], 'pd.DataFrame', 'SparkDataFrame']
+
+
+def _import_mysql_connector():
+    """
+    Import mysql.connector on first use and bind it to the module-level name.
+
+    Raises:
+        ImportError: If mysql-connector-python is not installed
+    """
+    global mysql
+    if mysql is None:
+        try:
+            import mysql.connector
+            import mysql.connector.pooling
+        except ImportError:
+            raise ImportError(
+                "mysql-connector-python is required. "
+                "Install it with: pip install mysql-connector-python"
+            )
+    return mysql
+
+@lru_cache(maxsize=256)
+def _column_names(description: tuple) -> List[str]:
+    """
+    Column names of a result set, cached per cursor description.
+
+    Repeated queries return the same description, so the name list is built once per
+    result shape. Callers must not mutate the returned list.
+    """
+    return [column[0] for column in description]
+
 
 class MySQLManager:
     """
@@ -91,14 +130,13 @@ class MySQLManager:
             ConfigurationError: If the configuration is invalid
             ConnectionError: If unable to establish connection pool
         """
-        try:
-            self.config = (config if isinstance(config, MySQLConfig) 
-                         else MySQLConfig.from_dict(config))
-        except ValueError as e:
-            raise ConfigurationError(f"Invalid configuration: {str(e)}")
+        # A MySQLConfig is frozen and was validated when it was built, so it is used as-is
+        self.config = (config if isinstance(config, MySQLConfig)
+                       else MySQLConfig.from_dict(config))
             
         self._pool = None
         self._pandas_df = None
+        self._spark_session = None
         
         # Initialize data format handlers
         self._initialize_data_handlers()
@@ -106,26 +144,72 @@ class MySQLManager:
 
     def _initialize_data_handlers(self) -> None:
         """Initialize handlers for different output formats."""
-        if self.config.output_format == "pandas":
+        if self.config.output_format in ("pandas", "spark"):
+            # Spark DataFrames are built from a pandas DataFrame via Arrow
             try:
                 import pandas as pd
                 self._pandas_df = pd
             except ImportError:
                 raise DataFormatError(
-                    "pandas is required for pandas output format. "
+                    f"pandas is required for {self.config.output_format} output format. "
                     "Install it with: pip install pandas"
                 )
 
+        if self.config.output_format == "spark":
+            # Only check that pyspark is installed; the JVM is started on the first query
+            try:
+                import pyspark.sql  # noqa: F401
+            except ImportError:
+                raise DataFormatError(
+                    "pyspark is required for spark output format. "
+                    "Install it with: pip install pyspark"
+                )
+
+    @property
+    def _spark(self):
+        """SparkSession for spark output, created on first use."""
+        if self._spark_session is None:
+            from pyspark.sql import SparkSession
+            spark = SparkSession.builder.getOrCreate()
+            # Ship pandas data to the JVM as Arrow batches instead of pickled rows
+            spark.conf.set("spark.sql.execution.arrow.pyspark.enabled", "true")
+            self._spark_session = spark
+        return self._spark_session
+
     def _initialize_connection_pool(self) -> None:
         """
         Initialize the MySQL connection pool.
         
+        Managers created with the same host, port, database, credentials and pool size
+        share one pool, so re-creating a manager reuses the open connections.
+        
+        Raises:
+            ConnectionError: If unable to create the connection pool
+        """
+        _import_mysql_connector()
+        key = (self.config.host, self.config.port, self.config.database,
+               self.config.user, self.config.password, self.config.max_connections,
+               self.config.use_pure)
+        with _POOL_CACHE_LOCK:
+            pool = _POOL_CACHE.get(key)
+            if pool is None:
+                pool = _POOL_CACHE[key] = self._create_pool()
+            else:
+                logger.info(f"Reusing connection pool to database: {self.config.database}")
+        self._pool = pool
+
+    def _create_pool(self):
+        """
+        Create a new MySQL connection pool for this manager's configuration.
+        
         Raises:
             ConnectionError: If unable to create the connection pool
         """
+        # The C extension parses rows in C; fall back to pure Python when it is not built
+        use_pure = self.config.use_pure or not getattr(mysql.connector, 'HAVE_CEXT', False)
         try:
             pool_config = {
-                'pool_name': 'wipekit_mysql_pool',
+                'pool_name': f"wipekit_mysql_pool_{next(_POOL_IDS)}",
                 'pool_size': self.config.max_connections,
                 'host': self.config.host,
                 'port': self.config.port,
@@ -133,12 +217,13 @@ class MySQLManager:
                 'user': self.config.user,
                 'password': self.config.password,
                 'charset': 'utf8mb4',
-                'use_pure': True,  # Recommended for better compatibility
+                'use_pure': use_pure,
                 'get_warnings': True,
             }
             
-            self._pool = mysql.connector.pooling.MySQLConnectionPool(**pool_config)
+            pool = mysql.connector.pooling.MySQLConnectionPool(**pool_config)
             logger.info(f"Successfully initialized connection pool to database: {self.config.database}")
+            return pool
             
         except mysql.connector.Error as e:
             raise ConnectionError(f"Failed to initialize connection pool: {str(e)}")
@@ -171,7 +256,9 @@ class MySQLManager:
     def execute_query(
         self, 
         query: str, 
-        params: Optional[Union[tuple, List[tuple], dict]] = None
+        params: Optional[Union[tuple, List[tuple], dict]] = None,
+        chunksize: Optional[int] = None,
+        prepared: bool = False
     ) -> ResultType:
         """
         Execute a SQL query and return the results in the specified format.
@@ -179,38 +266,86 @@ class MySQLManager:
         Args:
             query: The SQL query to execute
             params: Query parameters for parameterized queries
+            chunksize: When set, rows are fetched from the server in chunks of this many
+                rows and DataFrames are built chunk by chunk, so the raw rows of the
+                whole result are never held at once
+            prepared: Run the query as a server-side prepared statement. Rows then come
+                back in the binary protocol, so numeric and temporal values are not parsed
+                from text; params must be a tuple or list
             
         Returns:
-            Query results in the specified format (dict, pandas DataFrame)
+            Query results in the specified format (dict, pandas DataFrame, Spark DataFrame)
             
         Raises:
             ConnectionError: If there is a database connection error
             DataFormatError: If there is an error converting the result format
         """
+        output_format = self.config.output_format
         with self.get_connection() as conn:
             try:
-                cursor = conn.cursor(dictionary=True)
+                # Only dict output needs a dict per row; DataFrames are built from plain tuples
+                cursor = conn.cursor(dictionary=output_format == "dict", prepared=prepared)
                 cursor.execute(query, params)
                 
                 if not cursor.description:  # No data returned
                     return []
                     
-                result = cursor.fetchall()
-                
-                if self.config.output_format == "dict":
+                if output_format == "dict":
+                    if not chunksize:
+                        return cursor.fetchall()
+                    result = []
+                    for rows in self._fetch_chunks(cursor, chunksize):
+                        result.extend(rows)
                     return result
                     
-                elif self.config.output_format == "pandas":
+                columns = _column_names(tuple(cursor.description))
+                if output_format == "rows":
+                    row_type = row_class(tuple(columns))
+                    if not chunksize:
+                        return list(map(row_type, cursor.fetchall()))
+                    result = []
+                    for rows in self._fetch_chunks(cursor, chunksize):
+                        result.extend(map(row_type, rows))
+                    return result
+                pd = self._pandas_df
+                try:
+                    if not chunksize:
+                        df = pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+                    else:
+                        frames = [pd.DataFrame.from_records(rows, columns=columns)
+                                  for rows in self._fetch_chunks(cursor, chunksize)]
+                        df = (pd.concat(frames, ignore_index=True) if frames
+                              else pd.DataFrame(columns=columns))
+                except Exception as e:
+                    raise DataFormatError(f"Failed to convert to pandas DataFrame: {str(e)}")
+
+                if output_format == "spark":
                     try:
-                        return self._pandas_df.DataFrame(result)
+                        return self._spark.createDataFrame(df)
                     except Exception as e:
-                        raise DataFormatError(f"Failed to convert to pandas DataFrame: {str(e)}")
+                        raise DataFormatError(f"Failed to convert to Spark DataFrame: {str(e)}")
+                return df
                         
             except mysql.connector.Error as e:
                 raise ConnectionError(f"Query execution failed: {str(e)}")
             finally:
                 cursor.close()
 
+    @staticmethod
+    def _fetch_chunks(cursor, chunksize: int):
+        """
+        Yield the remaining rows of an executed cursor in lists of at most chunksize rows.
+        
+        Args:
+            cursor: Cursor on which a query has been executed
+            chunksize: Maximum number of rows per chunk
+        """
+        while True:
+            rows = cursor.fetchmany(chunksize)
+            if not rows:
+                return
+            yield rows
+
     def execute_batch(
         self, 
         query: str, 
@@ -219,6 +354,9 @@ class MySQLManager:
         """
         Execute a batch of parameterized queries.
         
+        INSERT ... VALUES statements are sent as multi-row INSERTs of up to 1000 rows
+        each; all chunks are committed together as one transaction.
+        
         Args:
             query: The SQL query template to execute
             params: List of parameter sets to use with the query
@@ -233,7 +371,8 @@ class MySQLManager:
         with self.get_connection() as conn:
             try:
                 cursor = conn.cursor()
-                cursor.executemany(query, params)
+                for start in range(0, len(params), _BATCH_ROWS):
+                    cursor.executemany(query, params[start:start + _BATCH_ROWS])
             except mysql.connector.Error as e:
                 raise ConnectionError(f"Batch execution failed: {str(e)}")
             finally:
@@ -9,7 +9,7 @@ error handling, and flexible data format conversions.
 Features:
 ---------
 - Connection pooling for efficient database access
-- Support for multiple output formats (dict, pandas DataFrame)
+- Support for multiple output formats (dict, Row tuples, pandas DataFrame, Spark DataFrame)
 - Context manager interface for safe connection handling
 - Error handling and automatic connection cleanup
 - Advanced features like connection sharding and RAC support
@@ -18,7 +18,7 @@ Features:
 Dependencies:
 ------------
 - Required: oracledb
-- Optional: pandas (for DataFrame output)
+- Optional: pandas (for DataFrame output), pyspark (for Spark output)
 
 Example:
 --------
@@ -38,8 +38,9 @@ with OracleManager(config) as oracle:
     df = oracle.execute_query('SELECT * FROM emp WHERE deptno = :1', (10,))
 """
 
-from typing import Optional, Dict, Any, List, Union, TYPE_CHECKING
+from typing import Optional, Dict, Any, Iterator, List, Union, TYPE_CHECKING
 from contextlib import contextmanager
+from functools import lru_cache
 from ..logging import configure_logger, get_logger
 
 try:
@@ -51,6 +52,7 @@ except ImportError:
     )
 
 from .config import OracleConfig
+from .rows import Row, row_class
 from ..exceptions import (
     ConnectionError,
     DataFormatError,
@@ -61,13 +63,70 @@ from ..exceptions import (
 # Type checking imports
 if TYPE_CHECKING:
     import pandas as pd
+    from pyspark.sql import DataFrame as SparkDataFrame
 
 # Type alias for query results
-ResultType = Union[List[Dict[str, Any]], 'pd.DataFrame']
+ResultType = Union[List[Dict[str, Any]], List[Row], 'pd.DataFrame', 'SparkDataFrame']
 # Logger configuration
 configure_logger()
 logger = get_logger("wipekit.read.oracle")
 
+@lru_cache(maxsize=1)
+def _get_pandas():
+    """Import pandas on first use; later calls return the cached module."""
+    try:
+        import pandas as pd
+    except ImportError:
+        raise DataFormatError(
+            "pandas is required for pandas output format. "
+            "Install it with: pip install pandas"
+        )
+    return pd
+
+@lru_cache(maxsize=1)
+def _get_spark():
+    """SparkSession shared by all managers, created on first use."""
+    try:
+        from pyspark.sql import SparkSession
+    except ImportError:
+        raise DataFormatError(
+            "pyspark is required for spark output format. "
+            "Install it with: pip install pyspark"
+        )
+    return SparkSession.builder.getOrCreate()
+
+@lru_cache(maxsize=1)
+def _get_pyarrow():
+    """pyarrow for arrow_fetch, or None when it or oracledb's DataFrame fetch is unavailable."""
+    if not hasattr(oracledb.Connection, "fetch_df_all"):  # oracledb < 3.0
+        return None
+    try:
+        import pyarrow
+    except ImportError:
+        return None
+    return pyarrow
+
+def _is_select(query) -> bool:
+    """True for plain SELECT statements, which can run without a commit."""
+    return isinstance(query, str) and query.lstrip()[:6].upper() == "SELECT"
+
+def _string_size_session_callback(max_size: int):
+    """
+    Pool session callback capping VARCHAR2 fetch buffers at max_size characters.
+    
+    Fixes the string memory blowup of reading wide VARCHAR2 columns that hold short
+    values: the driver sizes each column's buffer by its declared size times arraysize.
+    """
+    def output_type_handler(cursor, metadata):
+        if metadata.type_code is oracledb.DB_TYPE_VARCHAR and metadata.display_size > max_size:
+            return cursor.var(str, size=max_size, arraysize=cursor.arraysize)
+        return None
+
+    def init_session(connection, requested_tag):
+        connection.outputtypehandler = output_type_handler
+
+    return init_session
+
 class OracleManager:
     """
     A professional Oracle connection manager with connection pooling, error handling,
@@ -92,25 +151,10 @@ class OracleManager:
             raise ConfigurationError(f"Invalid configuration: {str(e)}")
             
         self._pool = None
-        self._pandas_df = None
         
-        # Initialize data format handlers
-        self._initialize_data_handlers()
+        # pandas/pyspark are imported on the first query that needs them
         self._initialize_connection_pool()
 
-    def _initialize_data_handlers(self) -> None:
-        """Initialize handlers for different output formats."""
-        if self.config.output_format == "pandas":
-            try:
-                import pandas as pd
-                self._pandas_df = pd
-            except ImportError:
-                raise DataFormatError(
-                    "pandas is required for pandas output format. "
-                    "Install it with: pip install pandas"
-                )
-
-
     def _initialize_connection_pool(self) -> None:
         """
         Initialize the Oracle connection pool.
@@ -125,8 +169,15 @@ class OracleManager:
                 'min': self.config.min_connections,
                 'max': self.config.max_connections,
                 'increment': 1,
-                'getmode': oracledb.POOL_GETMODE_WAIT
+                'getmode': oracledb.POOL_GETMODE_WAIT,
+                # Repeated SQL text reuses the parsed statement on each connection
+                'stmtcachesize': self.config.stmt_cache_size,
+                'ping_interval': self.config.ping_interval,
+                'max_lifetime_session': self.config.max_session_lifetime
             }
+            if self.config.max_string_size:
+                pool_config['session_callback'] = _string_size_session_callback(
+                    self.config.max_string_size)
             
             self._pool = oracledb.create_pool(
                 user=self.config.user,
@@ -145,10 +196,14 @@ class OracleManager:
         return f"{self.config.host}:{self.config.port}/{self.config.service_name}"
 
     @contextmanager
-    def get_connection(self):
+    def get_connection(self, readonly: bool = False):
         """
         Context manager for database connections.
         
+        Args:
+            readonly: Skip the commit round trip on exit, for blocks that only query.
+                Anything left uncommitted is rolled back when the session is released.
+        
         Yields:
             oracledb.Connection: Database connection from the pool
             
@@ -159,7 +214,8 @@ class OracleManager:
         try:
             conn = self._pool.acquire()
             yield conn
-            conn.commit()
+            if not readonly:
+                conn.commit()
         except oracledb.Error as e:
             if conn:
                 conn.rollback()
@@ -178,13 +234,25 @@ class OracleManager:
             params: Query parameters for parameterized queries
             
         Returns:
-            Query results in the specified format (dict, pandas DataFrame)
+            Query results in the specified format (dict, pandas DataFrame). With pandas
+            output and config.stream_chunksize set, a SELECT returns an iterator of
+            DataFrames of that many rows (see execute_query_iter); other statements run
+            at once.
             
         Raises:
             ConnectionError: If there is a database connection error
             DataFormatError: If there is an error converting the result format
         """
-        with self.get_connection() as conn:
+        select = _is_select(query)
+        if select and self.config.stream_chunksize and self.config.output_format == "pandas":
+            return self.execute_query_iter(query, params, self.config.stream_chunksize)
+        if select and self.config.arrow_fetch and self.config.output_format == "pandas":
+            pa = _get_pyarrow()
+            if pa is not None:
+                return self._fetch_arrow(pa, query, params)
+            logger.debug("arrow_fetch needs pyarrow and oracledb 3.0+; fetching rows instead")
+
+        with self.get_connection(readonly=select) as conn:
             try:
                 cursor = conn.cursor()
                 cursor.execute(query, params or ())
@@ -192,18 +260,111 @@ class OracleManager:
                 if not cursor.description:  # No data returned
                     return []
                 
-                # Convert to list of dictionaries
                 columns = [col[0] for col in cursor.description]
-                result = [dict(zip(columns, row)) for row in cursor.fetchall()]
-                
                 if self.config.output_format == "dict":
-                    return result
-                    
-                else:
-                    try:
-                        return self._pandas_df.DataFrame(result)
-                    except Exception as e:
-                        raise DataFormatError(f"Failed to convert to pandas DataFrame: {str(e)}")
+                    # The driver builds each dict as it fetches, so no intermediate
+                    # list of tuples is held next to the result
+                    cursor.rowfactory = lambda *row: dict(zip(columns, row))
+                    return cursor.fetchall()
+                return self._format_rows(columns, cursor.fetchall())
+                        
+            except oracledb.Error as e:
+                raise ConnectionError(f"Query execution failed: {str(e)}")
+            finally:
+                cursor.close()
+
+    def _fetch_arrow(self, pa, query: str, params) -> 'pd.DataFrame':
+        """
+        Fetch a query as Arrow columns and convert them to a pandas DataFrame.
+        
+        No Python object is created per row or value; the Arrow buffers are released
+        while the DataFrame is built.
+        
+        Raises:
+            ConnectionError: If there is a database connection error
+            DataFormatError: If there is an error converting the result format
+        """
+        with self.get_connection(readonly=_is_select(query)) as conn:
+            try:
+                odf = conn.fetch_df_all(query, params or ())
+            except oracledb.Error as e:
+                raise ConnectionError(f"Query execution failed: {str(e)}")
+        try:
+            table = pa.Table.from_arrays(odf.column_arrays(), names=odf.column_names())
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+        except Exception as e:
+            raise DataFormatError(f"Failed to convert to pandas DataFrame: {str(e)}")
+
+    def _format_rows(self, columns: List[str], rows: List[tuple]) -> ResultType:
+        """
+        Convert fetched row tuples into the configured output format.
+        
+        DataFrames are built straight from the tuples, column by column; dicts are only
+        created for dict output.
+        
+        Raises:
+            DataFormatError: If there is an error converting the result format
+        """
+        if self.config.output_format == "dict":
+            return [dict(zip(columns, row)) for row in rows]
+        if self.config.output_format == "rows":
+            return list(map(row_class(tuple(columns)), rows))
+        if self.config.output_format == "spark":
+            # Spark takes the tuples as they are, with the column names as the schema
+            spark = _get_spark()
+            try:
+                return spark.createDataFrame(rows, schema=columns)
+            except Exception as e:
+                raise DataFormatError(f"Failed to convert to Spark DataFrame: {str(e)}")
+        pd = _get_pandas()
+        try:
+            return pd.DataFrame.from_records(rows, columns=columns)
+        except Exception as e:
+            raise DataFormatError(f"Failed to convert to pandas DataFrame: {str(e)}")
+
+    def execute_query_iter(
+        self,
+        query: str,
+        params: Optional[Union[tuple, List[tuple], dict]] = None,
+        chunk_size: int = 10_000
+    ) -> Iterator[ResultType]:
+        """
+        Execute a SQL query and yield its results in chunks of the specified format.
+        
+        Rows are fetched in round trips of chunk_size rows, so at most one chunk is held
+        in memory at a time. The connection stays checked out until the iterator is
+        exhausted or closed.
+        
+        Args:
+            query: The SQL query to execute
+            params: Query parameters for parameterized queries
+            chunk_size: Number of rows fetched from the server per chunk
+            
+        Yields:
+            Chunks of at most chunk_size rows (list of dicts or pandas DataFrame)
+            
+        Raises:
+            ConnectionError: If there is a database connection error
+            DataFormatError: If there is an error converting the result format
+        """
+        with self.get_connection(readonly=_is_select(query)) as conn:
+            cursor = conn.cursor()
+            try:
+                # One chunk per round trip; prefetching one row more avoids an extra
+                # round trip to detect the end of small results
+                cursor.arraysize = chunk_size
+                cursor.prefetchrows = chunk_size + 1
+                cursor.execute(query, params or ())
+                
+                if not cursor.description:  # No data returned
+                    return
+                
+                columns = [col[0] for col in cursor.description]
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        return
+                    yield self._format_rows(columns, rows)
                         
             except oracledb.Error as e:
                 raise ConnectionError(f"Query execution failed: {str(e)}")
@@ -213,14 +374,24 @@ class OracleManager:
     def execute_batch(
         self,
         query: str,
-        params: List[Union[tuple, dict]]
-    ) -> None:
+        params: List[Union[tuple, dict]],
+        batch_errors: bool = False
+    ) -> Optional[List[tuple]]:
         """
         Execute a batch of parameterized queries.
         
+        Parameter sets are bound as arrays of config.batch_size rows, one round trip per
+        array; all arrays are committed together.
+        
         Args:
             query: The SQL query template to execute
             params: List of parameter sets to use with the query
+            batch_errors: Collect per-row errors instead of aborting the batch. Rows that
+                fail are skipped and the remaining rows are still executed and committed.
+            
+        Returns:
+            With batch_errors, a list of (row_offset, message) tuples for the rows that
+            failed, offsets counted from the start of params; otherwise None
             
         Raises:
             ConnectionError: If there is a database connection error
@@ -229,14 +400,22 @@ class OracleManager:
         if not params:
             raise ValidationError("params must not be empty for batch execution")
             
+        batch_size = self.config.batch_size
+        errors = [] if batch_errors else None
         with self.get_connection() as conn:
             try:
                 cursor = conn.cursor()
-                cursor.executemany(query, params)
+                for start in range(0, len(params), batch_size):
+                    cursor.executemany(query, params[start:start + batch_size],
+                                       batcherrors=batch_errors)
+                    if batch_errors:
+                        errors.extend((start + error.offset, error.message)
+                                      for error in cursor.getbatcherrors())
             except oracledb.Error as e:
                 raise ConnectionError(f"Batch execution failed: {str(e)}")
             finally:
                 cursor.close()
+        return errors
 
     def close(self) -> None:
         """
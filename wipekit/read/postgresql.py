@@ -9,7 +9,7 @@ and flexible data format conversions.
 Features:
 ---------
 - Connection pooling for efficient database connections
-- Support for multiple output formats (dict, pandas DataFrame)
+- Support for multiple output formats (dict, Row tuples, pandas DataFrame, Spark DataFrame)
 - Context manager interface for safe connection handling
 - Error handling and automatic connection cleanup
 - Table management utilities (creation, schema inspection)
@@ -17,7 +17,7 @@ Features:
 Dependencies:
 ------------
 - Required: psycopg2-binary
-- Optional: pandas (for DataFrame output)
+- Optional: pandas (for DataFrame output), pyspark (for Spark output)
 
 Example:
 --------
@@ -32,15 +32,23 @@ with PostgreSQLManager(config) as pg:
     df = pg.execute_query('SELECT * FROM mytable')
 """
 
-from typing import Optional, Dict, Any, List, Union, TYPE_CHECKING
+from typing import Optional, Dict, Any, Iterator, List, Sequence, Union, TYPE_CHECKING
+import io
+import itertools
+import re
+import weakref
+from collections import OrderedDict
 from contextlib import contextmanager
+from functools import lru_cache
+from uuid import uuid4
 from ..logging import configure_logger,get_logger
 
 # Third-party imports
 try:
     import psycopg2
+    from psycopg2 import sql
+    from psycopg2.extras import execute_values
     from psycopg2.pool import SimpleConnectionPool
-    from psycopg2.extras import RealDictCursor
 except ImportError:
     raise ImportError(
         "psycopg2-binary is required for PostgreSQL database connectivity. "
@@ -48,18 +56,71 @@ except ImportError:
     )
 
 from .config import PostgreSQLConfig
+from .rows import Row, row_class
 from ..exceptions import ConnectionError, DataFormatError, ValidationError
 
 # Type checking imports
 if TYPE_CHECKING:
     import pandas as pd
+    from pyspark.sql import DataFrame as SparkDataFrame
 
 # Define return type alias for clarity
-ResultType = Union[List[Dict[str, Any]], 'pd.DataFrame']
+ResultType = Union[List[Dict[str, Any]], List[Row], 'pd.DataFrame', 'SparkDataFrame']
 # Logger configuration
 configure_logger()
 logger = get_logger("wipekit.read.postgresql")
 
+# Prepared statements kept per connection; the least recently used one is deallocated
+_PREPARED_LIMIT = 256
+# Characters escaped in COPY text format values
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+# Client-side %s placeholders (and %% escapes) in a query
+_PLACEHOLDER = re.compile(r"%[%s]")
+
+def _is_select(query) -> bool:
+    """True for plain SELECT statements, which can run without a commit."""
+    return isinstance(query, str) and query.lstrip()[:6].upper() == "SELECT"
+
+def _copy_text(rows: Sequence[Sequence[Any]]) -> io.StringIO:
+    """Render rows in COPY text format (tab-separated, \\N for NULL)."""
+    buf = io.StringIO()
+    for row in rows:
+        buf.write("\t".join("\\N" if value is None else str(value).translate(_COPY_ESCAPES)
+                            for value in row))
+        buf.write("\n")
+    buf.seek(0)
+    return buf
+
+def _to_positional(query: str) -> str:
+    """Rewrite %s placeholders as $1, $2, ... for PREPARE."""
+    counter = itertools.count(1)
+    return _PLACEHOLDER.sub(
+        lambda m: "%" if m.group() == "%%" else f"${next(counter)}", query)
+
+@lru_cache(maxsize=1)
+def _get_pandas():
+    """Import pandas on first use; later calls return the cached module."""
+    try:
+        import pandas as pd
+    except ImportError:
+        raise DataFormatError(
+            "pandas is required for pandas output format. "
+            "Install it with: pip install pandas"
+        )
+    return pd
+
+@lru_cache(maxsize=1)
+def _get_spark():
+    """SparkSession shared by all managers, created on first use."""
+    try:
+        from pyspark.sql import SparkSession
+    except ImportError:
+        raise DataFormatError(
+            "pyspark is required for spark output format. "
+            "Install it with: pip install pyspark"
+        )
+    return SparkSession.builder.getOrCreate()
+
 class PostgreSQLManager:
     """
     A professional PostgreSQL connection manager with connection pooling, error handling,
@@ -75,19 +136,13 @@ class PostgreSQLManager:
             raise ValidationError(f"Invalid configuration: {str(e)}")
             
         self._pool: Optional[SimpleConnectionPool] = None
-        self._pandas_df = None
-        
-        # Lazy import of optional dependencies
-        if self.config.output_format == "pandas":
-            try:
-                import pandas as pd
-                self._pandas_df = pd
-            except ImportError:
-                raise DataFormatError(
-                    "pandas is required for pandas output format. "
-                    "Install it with: pip install pandas"
-                )
+        # Per pooled connection: query text -> prepared statement name
+        self._prepared = weakref.WeakKeyDictionary()
+        self._prepared_ids = itertools.count()
+        # Per pooled connection: reused default cursor (config.reuse_cursors)
+        self._cursors: Dict[Any, Any] = {}
         
+        # pandas/pyspark are imported on the first query that needs them
         self.initialize_pool()
 
     def initialize_pool(self) -> None:
@@ -100,18 +155,21 @@ class PostgreSQLManager:
                 port=self.config.port,
                 database=self.config.database,
                 user=self.config.user,
-                password=self.config.password,
-                cursor_factory=RealDictCursor
+                password=self.config.password
             )
             logger.info(f"Successfully initialized connection pool to database: {self.config.database}")
         except psycopg2.Error as e:
             raise ConnectionError(f"Failed to initialize connection pool: {str(e)}")
 
     @contextmanager
-    def get_connection(self):
+    def get_connection(self, readonly: bool = False):
         """
         Context manager for database connections.
         
+        Args:
+            readonly: Run the connection in autocommit mode for the block, skipping the
+                BEGIN and COMMIT round trips. Each statement then commits on its own.
+        
         Yields:
             psycopg2.extensions.connection: Database connection from the pool
             
@@ -121,8 +179,11 @@ class PostgreSQLManager:
         conn = None
         try:
             conn = self._pool.getconn()
+            if readonly:
+                conn.autocommit = True
             yield conn
-            conn.commit()
+            if not readonly:
+                conn.commit()
         except psycopg2.Error as e:
             if conn:
                 conn.rollback()
@@ -130,43 +191,180 @@ class PostgreSQLManager:
             raise ConnectionError(f"Database operation failed: {str(e)}")
         finally:
             if conn:
+                if readonly and not conn.closed:
+                    conn.autocommit = False
                 self._pool.putconn(conn)
+                # The pool closes connections returned beyond minconn
+                if conn.closed:
+                    self._cursors.pop(conn, None)
 
-    def execute_query(self, query: str, params: Optional[tuple] = None) -> ResultType:
+    def execute_query(self, query: Union[str, sql.Composable], params: Optional[tuple] = None,
+                      cursor_factory=None) -> ResultType:
         """
         Execute a SQL query and return the results in the specified format.
         
+        Rows are fetched as tuples; dicts are only built for dict output. With pandas
+        output and config.stream_chunksize set, a SELECT returns an iterator of DataFrames
+        of that many rows instead (see execute_query_iter); other statements run at once.
+        
+        Args:
+            query: The SQL query to execute, as a string or a psycopg2.sql composition
+                (e.g. with sql.Identifier for table names)
+            params: Query parameters for parameterized queries
+            cursor_factory: Optional psycopg2 cursor class (e.g. RealDictCursor); with dict
+                output its rows are returned as-is
+            
+        Raises:
+            ConnectionError: If there is a database connection error
+            DataFormatError: If there is an error converting the result format
+        """
+        select = _is_select(query)
+        if select and self.config.stream_chunksize and self.config.output_format == "pandas":
+            return self.execute_query_iter(query, params, self.config.stream_chunksize)
+
+        with self.get_connection(readonly=select) as conn:
+            return self._execute_query_on(conn, query, params, cursor_factory)
+
+    def _execute_query_on(self, conn, query: Union[str, sql.Composable],
+                          params: Optional[tuple] = None, cursor_factory=None) -> ResultType:
+        """
+        Run a query on an already checked-out connection (see execute_query).
+        
+        Nothing is committed here; the caller's get_connection() block commits once for
+        all the queries run on it.
+        """
+        reuse = self.config.reuse_cursors and cursor_factory is None
+        cur = self._cursor(conn) if reuse else conn.cursor(cursor_factory=cursor_factory)
+        try:
+            self._execute(conn, cur, query, params)
+            if not cur.description:  # No data returned
+                return []
+                
+            rows = cur.fetchall()
+            if cursor_factory is not None and self.config.output_format == "dict":
+                return rows
+            return self._format_rows([column.name for column in cur.description], rows)
+
+        except psycopg2.Error as e:
+            # Don't hand a cursor that failed to the next query
+            reuse = False
+            self._cursors.pop(conn, None)
+            raise ConnectionError(f"Query execution failed: {str(e)}")
+        finally:
+            if not reuse:
+                cur.close()
+
+    def _cursor(self, conn):
+        """Default cursor of a pooled connection, created on first use and then reused."""
+        cur = self._cursors.get(conn)
+        if cur is None or cur.closed:
+            cur = self._cursors[conn] = conn.cursor()
+        return cur
+
+    def _execute(self, conn, cur, query: Union[str, sql.Composable], params: Optional[tuple]) -> None:
+        """
+        Execute a query, as a prepared statement when config.enable_prepared is set.
+        
+        Only plain-string queries with positional (tuple/list) parameters are prepared;
+        psycopg2.sql compositions are executed directly. The statement is prepared the
+        first time its text is seen on a connection and executed with EXECUTE afterwards,
+        skipping parsing and planning on the server.
+        """
+        if not (self.config.enable_prepared and params and isinstance(params, (tuple, list))
+                and isinstance(query, str)):
+            cur.execute(query, params)
+            return
+            
+        prepared = self._prepared.get(conn)
+        if prepared is None:
+            prepared = self._prepared[conn] = OrderedDict()
+        name = prepared.get(query)
+        if name is None:
+            name = f"_wk_{next(self._prepared_ids)}"
+            cur.execute(f"PREPARE {name} AS {_to_positional(query)}")
+            prepared[query] = name
+            if len(prepared) > _PREPARED_LIMIT:
+                _, oldest = prepared.popitem(last=False)
+                cur.execute(f"DEALLOCATE {oldest}")
+        else:
+            prepared.move_to_end(query)
+        cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+
+    def _format_rows(self, columns: List[str], rows: List[tuple]) -> ResultType:
+        """
+        Convert fetched row tuples into the configured output format.
+        
+        Raises:
+            DataFormatError: If there is an error converting the result format
+        """
+        if self.config.output_format == "dict":
+            return [dict(zip(columns, row)) for row in rows]
+        if self.config.output_format == "rows":
+            return list(map(row_class(tuple(columns)), rows))
+        if self.config.output_format == "spark":
+            # Spark takes the tuples as they are, with the column names as the schema
+            spark = _get_spark()
+            try:
+                return spark.createDataFrame(rows, schema=columns)
+            except Exception as e:
+                raise DataFormatError(f"Failed to convert to Spark DataFrame: {str(e)}")
+        pd = _get_pandas()
+        try:
+            return pd.DataFrame.from_records(rows, columns=columns)
+        except Exception as e:
+            raise DataFormatError(f"Failed to convert to pandas DataFrame: {str(e)}")
+
+    def execute_query_iter(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        chunk_size: int = 10_000
+    ) -> Iterator[ResultType]:
+        """
+        Execute a SELECT query and yield its results in chunks of the specified format.
+        
+        The query runs on a server-side (named) cursor, so at most chunk_size rows are
+        held in memory at a time. The connection stays checked out until the iterator
+        is exhausted or closed.
+        
+        Args:
+            query: The SELECT query to execute
+            params: Query parameters for parameterized queries
+            chunk_size: Number of rows fetched from the server per chunk
+            
+        Yields:
+            Chunks of at most chunk_size rows (list of dicts or pandas DataFrame)
+            
         Raises:
             ConnectionError: If there is a database connection error
             DataFormatError: If there is an error converting the result format
         """
         with self.get_connection() as conn:
-            with conn.cursor() as cur:
+            # Named cursors are declared on the server and fetched from in batches
+            with conn.cursor(name=f"wipekit_{uuid4().hex}") as cur:
+                cur.itersize = chunk_size
                 try:
                     cur.execute(query, params)
-                    if not cur.description:  # No data returned
-                        return []
-                        
-                    result = cur.fetchall()
-                    
-                    if self.config.output_format == "dict":
-                        return result
-                        
-                    else:
-                        try:
-                            return self._pandas_df.DataFrame(result)
-                        except Exception as e:
-                            raise DataFormatError(f"Failed to convert to pandas DataFrame: {str(e)}")
-
+                    columns = None
+                    while True:
+                        rows = cur.fetchmany(chunk_size)
+                        if not rows:
+                            return
+                        # A named cursor only has a description after the first fetch
+                        if columns is None:
+                            columns = [column.name for column in cur.description]
+                        yield self._format_rows(columns, rows)
                 except psycopg2.Error as e:
                     raise ConnectionError(f"Query execution failed: {str(e)}")
 
-    def table_exists(self, table_name: str) -> bool:
+    def table_exists(self, table_name: str, conn=None) -> bool:
         """
         Check if a table exists in the database.
         
         Args:
             table_name (str): Name of the table to check
+            conn: Optional connection from an open get_connection() block to run the
+                check on, instead of checking out (and committing) a separate one
             
         Returns:
             bool: True if table exists, False otherwise
@@ -183,15 +381,22 @@ class PostgreSQLManager:
                 WHERE table_name = %s
             );
         """
-        result = self.execute_query(query, (table_name,))
+        if conn is not None:
+            result = self._execute_query_on(conn, query, (table_name,))
+        else:
+            # Not through execute_query, which may return a lazy DataFrame iterator
+            with self.get_connection(readonly=True) as conn:
+                result = self._execute_query_on(conn, query, (table_name,))
         return result[0]['exists'] if result else False
 
-    def get_table_schema(self, table_name: str) -> List[Dict[str, Any]]:
+    def get_table_schema(self, table_name: str, conn=None) -> List[Dict[str, Any]]:
         """
         Get the schema information for a table.
         
         Args:
             table_name (str): Name of the table
+            conn: Optional connection from an open get_connection() block to run the
+                query on, instead of checking out (and committing) a separate one
             
         Returns:
             List[Dict[str, Any]]: Column information for the table
@@ -210,7 +415,54 @@ class PostgreSQLManager:
             WHERE table_name = %s
             ORDER BY ordinal_position;
         """
-        return self.execute_query(query, (table_name,))
+        if conn is None:
+            # Not through execute_query, which may return a lazy DataFrame iterator
+            with self.get_connection(readonly=True) as conn:
+                return self._execute_query_on(conn, query, (table_name,))
+        return self._execute_query_on(conn, query, (table_name,))
+
+    def execute_batch_insert(self, table: str, columns: Sequence[str],
+                             rows: Sequence[Sequence[Any]], use_copy: bool = False) -> None:
+        """
+        Insert many rows into a table in one transaction.
+        
+        Rows are sent as multi-row INSERT ... VALUES statements of config.batch_size rows
+        each, one round trip per statement, with values adapted by psycopg2. With
+        use_copy they are streamed through COPY ... FROM STDIN instead, which is much
+        faster for large loads and skips the SQL parser.
+        
+        Args:
+            table: Table name, optionally schema-qualified ("schema.table")
+            columns: Column names, in the order of the values in each row
+            rows: Row tuples to insert
+            use_copy: Load through COPY. Values are sent as their str() text, so only
+                plain scalar values (numbers, strings, dates, booleans, None) load as they
+                would through INSERT; bytes, lists and dicts do not.
+            
+        Raises:
+            ConnectionError: If there is a database connection error
+            ValidationError: If the parameters are invalid
+        """
+        if not rows:
+            raise ValidationError("rows must not be empty for batch insert")
+        if not columns:
+            raise ValidationError("columns must not be empty for batch insert")
+            
+        target = sql.SQL("{} ({})").format(
+            sql.Identifier(*table.split(".")),
+            sql.SQL(", ").join(map(sql.Identifier, columns)))
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                try:
+                    if use_copy:
+                        cur.copy_expert(sql.SQL("COPY {} FROM STDIN").format(target),
+                                        _copy_text(rows))
+                    else:
+                        execute_values(
+                            cur, sql.SQL("INSERT INTO {} VALUES %s").format(target).as_string(cur),
+                            rows, page_size=self.config.batch_size)
+                except psycopg2.Error as e:
+                    raise ConnectionError(f"Batch insert failed: {str(e)}")
 
     def close(self) -> None:
         """
@@ -221,6 +473,7 @@ class PostgreSQLManager:
         """
         try:
             if self._pool:
+                self._cursors.clear()
                 self._pool.closeall()
                 logger.info("Closed all database connections")
         except Exception as e:
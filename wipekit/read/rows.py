@@ -0,0 +1,90 @@
+"""
+Lightweight result rows for the "rows" output format.
+
+A Row is an immutable tuple with read-only, dict-style access by column name. All rows
+of a result share one generated subclass that holds the column names, so each row costs
+no more memory than a plain tuple, which is a fraction of an equivalent dict.
+
+Example:
+    >>> Point = row_class(("x", "y"))
+    >>> p = Point((1, 2))
+    >>> p["x"], p.y, dict(p.items())
+    (1, 2, {'x': 1, 'y': 2})
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Tuple
+
+
+class Row(tuple):
+    """
+    Base class of result rows: a tuple whose values can also be read by column name.
+
+    Indexing with a string, attribute access, keys(), items() and get() follow the
+    column names; iteration, len() and ``in`` behave as for the underlying tuple.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _index: Dict[str, int] = {}
+
+    def __getitem__(self, key):
+        if type(key) is str:
+            try:
+                key = self._index[key]
+            except KeyError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return tuple.__getitem__(self, self._index[name])
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value of column key, or default if there is no such column."""
+        index = self._index.get(key)
+        return default if index is None else tuple.__getitem__(self, index)
+
+    def keys(self) -> Tuple[str, ...]:
+        """Column names, in result order."""
+        return self._fields
+
+    def values(self) -> Tuple[Any, ...]:
+        """Column values, in result order."""
+        return tuple(self)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """(column, value) pairs, in result order."""
+        return zip(self._fields, self)
+
+    def _asdict(self) -> Dict[str, Any]:
+        """The row as a regular dict."""
+        return dict(zip(self._fields, self))
+
+    def __repr__(self) -> str:
+        return "Row(" + ", ".join(f"{k}={v!r}" for k, v in zip(self._fields, self)) + ")"
+
+    def __reduce__(self):
+        # Generated subclasses cannot be pickled by name; rebuild them from the columns
+        return (_rebuild_row, (self._fields, tuple(self)))
+
+
+def _rebuild_row(fields: Tuple[str, ...], values: Tuple[Any, ...]) -> Row:
+    """Unpickle a Row: recreate (or look up) its class and instantiate it."""
+    return row_class(fields)(values)
+
+
+@lru_cache(maxsize=256)
+def row_class(columns: Tuple[str, ...]) -> type:
+    """
+    Row subclass for a result with the given column names, cached per column tuple.
+
+    Instances are created from a row tuple: ``row_class(columns)(values)``. When a
+    column name repeats, name lookups return the first such column.
+    """
+    index: Dict[str, int] = {}
+    for position, column in enumerate(columns):
+        index.setdefault(column, position)
+    return type("Row", (Row,), {"__slots__": (), "_fields": columns, "_index": index})
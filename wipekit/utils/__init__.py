@@ -6,12 +6,14 @@ from wipekit.utils.logging_config import (
     configure_development_logging,
     configure_testing_logging,
     configure_production_logging,
-    configure_high_performance_logging
+    configure_high_performance_logging,
+    configure_logging_from_env
 )
 
 __all__ = [
     'configure_development_logging',
     'configure_testing_logging',
     'configure_production_logging',
-    'configure_high_performance_logging'
+    'configure_high_performance_logging',
+    'configure_logging_from_env'
 ]
\ No newline at end of file